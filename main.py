@@ -1,15 +1,14 @@
 import pygame
 
-from scrabble import board
-from scrabble.board import Board
-from scrabble.dictionary import Node, Tree
-from scrabble.movegenerator import MoveGenerator
-from scrabble.primitives import Move, PositionUtils
+from scrabble.primitives import POSITIONS, Move, Position, PositionUtils
 from solver import Solver
 from ui import *
 
+ASCII_LOWERCASE = frozenset("abcdefghijklmnopqrstuvwxyz")
 
-def handle_board_mouse_input(pos: tuple[int, int]):
+
+def handle_board_mouse_input(pos: tuple[int, int]) -> bool:
+    # returns whether the arrow changed, clicks only ever change the arrow and never the board
     global arrow_pos, arrow_across
 
     board_pos = coords_to_pos((pos[0], pos[1] - TOOLBAR_H))
@@ -26,6 +25,9 @@ def handle_board_mouse_input(pos: tuple[int, int]):
         # remove arrow if previously down
         else:
             arrow_pos = None
+        return True
+
+    return False
 
 
 def handle_board_keyboard_input(event: pygame.event.Event):
@@ -36,7 +38,7 @@ def handle_board_keyboard_input(event: pygame.event.Event):
 
     direction = (0, 1) if arrow_across else (1, 0)
     letter = event.unicode.lower()
-    if letter in list("abcdefghijklmnopqrstuvwxyz") and not PositionUtils.out_of_bounds(arrow_pos):
+    if letter in ASCII_LOWERCASE and not PositionUtils.out_of_bounds(arrow_pos):
         # remove overlapping edit tile if it exists
         try:
             solver.edits -= (solver.edits.get_tile(arrow_pos), arrow_pos)
@@ -89,7 +91,7 @@ def handle_rack_keyboard_input(event: pygame.event.Event):
         return
 
     letter = event.unicode
-    if letter in list("abcdefghijklmnopqrstuvwxyz"):
+    if letter in ASCII_LOWERCASE:
         solver.rack.append(letter.upper())
     elif letter == " ":
         if solver.rack.count(" ") < 2:
@@ -142,7 +144,7 @@ def handle_calc_move():
     solver.history.append(solver.edits)
 
     # make computer move
-    computer_move = max(solver.move_generator.calc_all_moves(solver.rack), key=solver.board.calc_score)
+    computer_move = solver.calc_best_move()
     words_formed = list(solver.board.get_words_formed(computer_move))
     if words_formed:
         solver.status_text += (
@@ -166,6 +168,37 @@ def handle_calc_move():
     solver.last_move = computer_move
 
 
+def arrow_squares(*positions: Position | None) -> set[Position]:
+    # typing into the last square of a row or column leaves the arrow just off the board, where there is no square
+    return {pos for pos in positions if pos is not None and not PositionUtils.out_of_bounds(pos)}
+
+
+def arrow_on_board() -> bool:
+    return arrow_pos is not None and not PositionUtils.out_of_bounds(arrow_pos)
+
+
+def moved_squares(moves: list[Move]) -> set[Position]:
+    return {pos for move in moves for pos in move.all_positions}
+
+
+def edited_squares(prev_edits: Move) -> set[Position]:
+    # squares where an edit tile was added, removed or replaced
+    return {pos for _, pos in set(prev_edits.tiles) ^ set(solver.edits.tiles)}
+
+
+def board_snapshot() -> tuple[bytes, Move, Move]:
+    return solver.board.board.tobytes(), solver.last_move.copy(), solver.edits.copy()
+
+
+def changed_squares(snapshot: tuple[bytes, Move, Move]) -> set[Position]:
+    # squares that are drawn differently than when the snapshot was taken, because their tile changed or they moved in
+    # or out of the last move or the edits
+    prev_board, prev_last_move, prev_edits = snapshot
+    board = solver.board.board.tobytes()
+    changed = {POSITIONS[idx] for idx in range(225) if board[idx] != prev_board[idx]}
+    return changed | (prev_last_move.all_positions ^ solver.last_move.all_positions) | edited_squares(prev_edits)
+
+
 # setup
 solver = Solver()
 pygame.init()
@@ -175,10 +208,11 @@ running = True
 focus_board = False  # True for board, False for rack
 arrow_pos = None
 arrow_across = True
-draw_board(solver)
-draw_toolbar(solver)
-draw_rack(solver)
-draw_status_bar(solver)
+dirty_rects: list[Rect] = []  # areas of the screen redrawn since the last display update
+dirty_rects.extend(draw_board(solver))
+dirty_rects.append(draw_toolbar(solver))
+dirty_rects.append(draw_rack(solver))
+dirty_rects.append(draw_status_bar(solver))
 while running:
     # poll for events
     for event in pygame.event.get():
@@ -190,70 +224,88 @@ while running:
             # clicked on board
             if BOARD_RECT.collidepoint(pos):
                 focus_board = True
-                handle_board_mouse_input(pos)
-                draw_board(solver)
-                if arrow_pos is not None:
-                    draw_arrow(arrow_pos, arrow_across)
-                    draw_rack(solver)
+                prev_arrow_pos = arrow_pos
+                # only the squares under the old and new arrow need redrawing
+                if handle_board_mouse_input(pos):
+                    dirty_rects.extend(draw_board(solver, arrow_squares(prev_arrow_pos, arrow_pos)))
+                    if arrow_pos is not None:
+                        if arrow_on_board():
+                            dirty_rects.append(draw_arrow(arrow_pos, arrow_across))
+                        dirty_rects.append(draw_rack(solver))
             # clicked on rack
             elif RACK_RECT.collidepoint(pos):
                 focus_board = False
             # clicked on toolbar icon
             elif UNDO_RECT.collidepoint(pos):
+                undo_count = len(solver.undo_history)
                 handle_undo()
-                draw_board(solver)
+                dirty = moved_squares(solver.undo_history[undo_count:]) | arrow_squares(arrow_pos)
+                dirty_rects.extend(draw_board(solver, dirty))
                 if arrow_pos is not None:
-                    draw_arrow(arrow_pos, arrow_across)
-                    draw_rack(solver)
-                draw_status_bar(solver)
+                    if arrow_on_board():
+                        dirty_rects.append(draw_arrow(arrow_pos, arrow_across))
+                    dirty_rects.append(draw_rack(solver))
+                dirty_rects.append(draw_status_bar(solver))
             elif REDO_RECT.collidepoint(pos):
+                history_count = len(solver.history)
                 handle_redo()
-                draw_board(solver)
+                dirty = moved_squares(solver.history[history_count:]) | arrow_squares(arrow_pos)
+                dirty_rects.extend(draw_board(solver, dirty))
                 arrow_pos = None
-                draw_status_bar(solver)
+                dirty_rects.append(draw_status_bar(solver))
             elif CLEAR_EDITS_RECT.collidepoint(pos):
+                dirty = moved_squares([solver.edits]) | arrow_squares(arrow_pos)
                 handle_clear_edits()
-                draw_board(solver)
+                dirty_rects.extend(draw_board(solver, dirty))
                 arrow_pos = None
             elif CLEAR_ALL_RECT.collidepoint(pos):
+                snapshot = board_snapshot()
                 handle_clear_all()
-                draw_board(solver)
-                if arrow_pos is not None:
-                    draw_arrow(arrow_pos, arrow_across)
-                draw_rack(solver)
-                draw_status_bar(solver)
+                dirty_rects.extend(draw_board(solver, changed_squares(snapshot) | arrow_squares(arrow_pos)))
+                if arrow_on_board():
+                    dirty_rects.append(draw_arrow(arrow_pos, arrow_across))
+                dirty_rects.append(draw_rack(solver))
+                dirty_rects.append(draw_status_bar(solver))
             elif LEGAL_CHECK_RECT.collidepoint(pos):
                 solver.legal_check = not solver.legal_check
-                draw_toolbar(solver)
+                dirty_rects.append(draw_toolbar(solver))
             elif CALC_MOVE_RECT.collidepoint(pos):
+                snapshot = board_snapshot()
                 handle_calc_move()
-                draw_board(solver)
-                draw_rack(solver)
+                dirty_rects.extend(draw_board(solver, changed_squares(snapshot) | arrow_squares(arrow_pos)))
+                dirty_rects.append(draw_rack(solver))
                 arrow_pos = None
-                draw_status_bar(solver)
+                dirty_rects.append(draw_status_bar(solver))
 
         elif event.type == pygame.KEYDOWN:
             # calc move if enter is pressed
             if event.key == pygame.K_RETURN:
+                snapshot = board_snapshot()
                 handle_calc_move()
-                draw_board(solver)
-                draw_rack(solver)
+                dirty_rects.extend(draw_board(solver, changed_squares(snapshot) | arrow_squares(arrow_pos)))
+                dirty_rects.append(draw_rack(solver))
                 arrow_pos = None
-                draw_status_bar(solver)
+                dirty_rects.append(draw_status_bar(solver))
             # keydown in board
             elif focus_board:
+                prev_arrow_pos = arrow_pos
+                prev_edits = solver.edits.copy()
                 handle_board_keyboard_input(event)
-                draw_board(solver)
+                dirty = edited_squares(prev_edits) | arrow_squares(prev_arrow_pos, arrow_pos)
+                dirty_rects.extend(draw_board(solver, dirty))
                 if arrow_pos is not None:
-                    draw_arrow(arrow_pos, arrow_across)
-                    draw_rack(solver)
+                    if arrow_on_board():
+                        dirty_rects.append(draw_arrow(arrow_pos, arrow_across))
+                    dirty_rects.append(draw_rack(solver))
             # keydown in rack
             else:
                 handle_rack_keyboard_input(event)
-                draw_rack(solver)
+                dirty_rects.append(draw_rack(solver))
 
-    # update
-    pygame.display.flip()
+    # update only the parts of the screen that were redrawn
+    if dirty_rects:
+        pygame.display.update(dirty_rects)
+        dirty_rects.clear()
     clock.tick(30)
 
 pygame.quit()
@@ -0,0 +1,795 @@
+"""Compiled kernels for the scoring and move generation hot paths.
+
+The kernels work on the flat 225-byte board buffer of :class:`scrabble.board.Board` and on lookup tables indexed by
+flat position or ASCII code, so they are nothing more than integer loops. The tiles of a move being checked are passed
+in a separate 225-byte overlay buffer, with a tile code at the flat position of each placed tile and 0 elsewhere,
+so the board itself is never written to. When Numba is installed they are compiled to
+machine code, otherwise they run as plain Python functions.
+
+The move generation kernels walk the dictionary through the dense arrays of :meth:`scrabble.dictionary.Tree.to_arrays`.
+They are only worth running when compiled, so :class:`scrabble.movegenerator.MoveGenerator` checks :data:`HAVE_NUMBA`
+and otherwise falls back to its Python generators.
+"""
+
+from __future__ import annotations
+
+import numpy as np
+
+# numba compiles globals into the cached kernels as constants, so the cache must be invalidated by editing this file
+# whenever any of these constants change
+from scrabble.dictionary import ALL_LETTERS_MASK, NO_NODE, ROOT
+from scrabble.primitives import EMPTY
+
+try:
+    from numba import njit
+
+    HAVE_NUMBA = True
+except ImportError:  # numba is optional, run the kernels uncompiled
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """Stand-in for :func:`numba.njit` that returns the decorated function unchanged."""
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def tile_at(board, overlay, idx):
+    """Returns the code of the tile at a flat position, preferring the tile in the overlay."""
+    tile = overlay[idx]
+    if tile == 0:
+        tile = board[idx]
+    return tile
+
+
+@njit(cache=True)
+def traverse_word(board, overlay, row, col, d_row, d_col):
+    """Finds the word that passes through a square along an axis.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes.
+    overlay : bytearray
+        Overlay buffer of tiles placed by a move.
+    row, col : int
+        Position of a square with a tile on it.
+    d_row, d_col : int
+        Direction of the axis. (0, 1) is a row traversal, (1, 0) is a column traversal.
+
+    Returns
+    -------
+    int
+        Row of the first tile of the word.
+    int
+        Column of the first tile of the word.
+    int
+        Number of tiles in the word.
+    """
+    # walk backwards to the first tile
+    r, c = row - d_row, col - d_col
+    while 0 <= r <= 14 and 0 <= c <= 14 and tile_at(board, overlay, r * 15 + c) != EMPTY:
+        r -= d_row
+        c -= d_col
+    start_row, start_col = r + d_row, c + d_col
+
+    # walk forwards past the last tile
+    r, c = row + d_row, col + d_col
+    while 0 <= r <= 14 and 0 <= c <= 14 and tile_at(board, overlay, r * 15 + c) != EMPTY:
+        r += d_row
+        c += d_col
+
+    return start_row, start_col, (r - start_row) * d_row + (c - start_col) * d_col
+
+
+@njit(cache=True)
+def has_neighbour(board, overlay, row, col, d_row, d_col):
+    """Checks whether a square has a tile next to it on either side along an axis.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes.
+    overlay : bytearray
+        Overlay buffer of tiles placed by a move.
+    row, col : int
+        Position of the square.
+    d_row, d_col : int
+        Direction of the axis. (0, 1) is a row traversal, (1, 0) is a column traversal.
+
+    Returns
+    -------
+    bool
+        Whether either neighbouring square along the axis has a tile on it.
+    """
+    r, c = row - d_row, col - d_col
+    if 0 <= r <= 14 and 0 <= c <= 14 and tile_at(board, overlay, r * 15 + c) != EMPTY:
+        return True
+    r, c = row + d_row, col + d_col
+    return 0 <= r <= 14 and 0 <= c <= 14 and tile_at(board, overlay, r * 15 + c) != EMPTY
+
+
+@njit(cache=True)
+def _score_word(board, overlay, start_row, start_col, d_row, d_col, length, letter_mult, word_mult, tile_values):
+    """Calculates the score of a single word found by :func:`traverse_word`.
+
+    Bonus squares only apply to the newly-placed tiles in ``overlay``.
+    """
+    score = 0
+    word_multiplier = 1
+
+    for i in range(length):
+        idx = (start_row + i * d_row) * 15 + start_col + i * d_col
+
+        tile = overlay[idx]
+        if tile == 0:
+            score += tile_values[board[idx]]
+        else:  # bonus squares only count for newly-placed tiles
+            score += tile_values[tile] * letter_mult[idx]
+            word_multiplier *= word_mult[idx]
+
+    return score * word_multiplier
+
+
+@njit(cache=True)
+def word_spans(board, overlay, placed, across):
+    """Finds all words formed by a move.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes, without the move made.
+    overlay : bytearray
+        Overlay buffer of the tiles placed by the move.
+    placed : bytes
+        Flat positions of the tiles placed by the move. Must not be empty.
+    across : bool
+        Whether the move is across or down.
+
+    Returns
+    -------
+    list[tuple[int, int, int, int, int]]
+        Start row, start column, row direction, column direction and length of each word formed, starting with the
+        original word.
+    """
+    if across:
+        d_row, d_col = 0, 1
+    else:
+        d_row, d_col = 1, 0
+
+    # find the original word
+    row, col = placed[0] // 15, placed[0] % 15
+    start_row, start_col, length = traverse_word(board, overlay, row, col, d_row, d_col)
+    spans = [(start_row, start_col, d_row, d_col, length)]
+
+    # find the words formed perpendicular to the original word
+    for idx in placed:
+        # a lone tile on the perpendicular axis does not form a word
+        if not has_neighbour(board, overlay, idx // 15, idx % 15, d_col, d_row):
+            continue
+
+        start_row, start_col, length = traverse_word(board, overlay, idx // 15, idx % 15, d_col, d_row)
+
+        # words are at least 2 letters long
+        if length > 1:
+            spans.append((start_row, start_col, d_col, d_row, length))
+
+    return spans
+
+
+@njit(cache=True)
+def cross_sums(board, d_row, d_col, tile_values, out):
+    """Finds the sum of tile values of the existing tiles in the word formed through each empty square along an axis.
+
+    A tile placed on an empty square forms a word along the axis with the tiles next to it. The value of those tiles
+    never depends on the tile placed, so it is found once per board instead of once per move scored.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes.
+    d_row, d_col : int
+        Direction of the axis. (0, 1) is a row traversal, (1, 0) is a column traversal.
+    tile_values : bytes
+        Lookup table of tile values indexed by ASCII code.
+    out : bytearray
+        225-byte buffer that is filled with one more than the sum for each empty square that has a tile next to it along
+        the axis, and 0 for every other square. The sum of every tile in the game is less than 255, so it always fits.
+    """
+    for idx in range(225):
+        out[idx] = 0
+        if board[idx] != EMPTY:
+            continue
+
+        total = 0
+        found = False
+        row, col = idx // 15, idx % 15
+
+        # walk backwards over the tiles before the square
+        r, c = row - d_row, col - d_col
+        while 0 <= r <= 14 and 0 <= c <= 14 and board[r * 15 + c] != EMPTY:
+            total += tile_values[board[r * 15 + c]]
+            found = True
+            r -= d_row
+            c -= d_col
+
+        # walk forwards over the tiles after the square
+        r, c = row + d_row, col + d_col
+        while 0 <= r <= 14 and 0 <= c <= 14 and board[r * 15 + c] != EMPTY:
+            total += tile_values[board[r * 15 + c]]
+            found = True
+            r += d_row
+            c += d_col
+
+        if found:
+            out[idx] = total + 1
+
+
+@njit(cache=True)
+def _score_placed(board, overlay, placed, start, end, across, cross_sums, letter_mult, word_mult, tile_values):
+    """Calculates the score of the move whose tiles are at ``placed[start:end]``, see :func:`score_move`."""
+    if start == end:
+        return 0
+
+    if across:
+        d_row, d_col = 0, 1
+    else:
+        d_row, d_col = 1, 0
+
+    # score the original word
+    row, col = placed[start] // 15, placed[start] % 15
+    start_row, start_col, length = traverse_word(board, overlay, row, col, d_row, d_col)
+    total_score = _score_word(
+        board, overlay, start_row, start_col, d_row, d_col, length, letter_mult, word_mult, tile_values
+    )
+
+    # score the words formed perpendicular to the original word, the only newly-placed tile in each of them is the one
+    # the word passes through
+    for i in range(start, end):
+        idx = placed[i]
+        cross_sum = cross_sums[idx]
+        if cross_sum:
+            total_score += (cross_sum - 1 + tile_values[overlay[idx]] * letter_mult[idx]) * word_mult[idx]
+
+    # 7-letter bonus
+    if end - start == 7:
+        total_score += 50
+
+    return total_score
+
+
+@njit(cache=True)
+def score_move(board, overlay, placed, across, cross_sums, letter_mult, word_mult, tile_values):
+    """Calculates the score of a move.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes, without the move made.
+    overlay : bytearray
+        Overlay buffer of the tiles placed by the move.
+    placed : bytes
+        Flat positions of the tiles placed by the move.
+    across : bool
+        Whether the move is across or down.
+    cross_sums : bytearray
+        Output of :func:`cross_sums` for the board along the axis perpendicular to the move.
+    letter_mult, word_mult : bytes
+        Letter and word multiplier of each square, indexed by flat position.
+    tile_values : bytes
+        Lookup table of tile values indexed by ASCII code.
+
+    Returns
+    -------
+    int
+        The total score of the move.
+    """
+    return _score_placed(
+        board, overlay, placed, 0, len(placed), across, cross_sums, letter_mult, word_mult, tile_values
+    )
+
+
+@njit(cache=True)
+def score_moves(
+    board, overlay, placed, tiles, offsets, across, across_sums, down_sums, letter_mult, word_mult, tile_values, scores
+):
+    """Calculates the scores of many moves in one call.
+
+    Parameters
+    ----------
+    board : bytearray
+        Flat board buffer of tile codes, without any of the moves made.
+    overlay : bytearray
+        225-byte scratch buffer of zeros. Each move is written to it while it is scored and then cleared again.
+    placed : bytes
+        Flat positions of the tiles placed by every move, one move after another.
+    tiles : bytes
+        Tile codes of the tiles in ``placed``.
+    offsets : ndarray
+        Index in ``placed`` of the first tile of each move, followed by ``len(placed)``.
+    across : bytes
+        Whether each move is across (1) or down (0).
+    across_sums, down_sums : bytearray
+        Output of :func:`cross_sums` for scoring across and down moves.
+    letter_mult, word_mult : bytes
+        Letter and word multiplier of each square, indexed by flat position.
+    tile_values : bytes
+        Lookup table of tile values indexed by ASCII code.
+    scores : ndarray
+        Array that is filled with the total score of each move.
+    """
+    for move in range(len(offsets) - 1):
+        start, end = offsets[move], offsets[move + 1]
+        for i in range(start, end):
+            overlay[placed[i]] = tiles[i]
+
+        if across[move]:
+            cross_sums = across_sums
+        else:
+            cross_sums = down_sums
+        scores[move] = _score_placed(
+            board, overlay, placed, start, end, across[move], cross_sums, letter_mult, word_mult, tile_values
+        )
+
+        for i in range(start, end):
+            overlay[placed[i]] = 0
+
+
+# columns of the explicit stacks of the move generation kernels, each row holds the state of one step of the search
+_NODE = 0  # id of the dictionary node reached
+_CHOICES = 1  # tiles left to try next, see _choices
+_RACK_BITS = 2  # letter set bitmask of the letters left in the rack
+_BLANKS = 3  # number of blanks left in the rack
+_LENGTH = 4  # number of tiles placed
+_USED = 5  # letter index of the rack tile used to reach the step, or -1 if none was used
+_NEXT = 52  # choice of following the tile already on the square
+
+
+@njit(cache=True)
+def _choices(letters, rack_bits, blanks):
+    """Returns the tiles that can be placed for each letter in ``letters``.
+
+    Bit ``2 * letter`` is set if a tile of the letter is left in the rack and bit ``2 * letter + 1`` is set if a blank is
+    left, so taking the lowest set bit first tries every letter in order, with its tile before a blank.
+    """
+    choices = 0
+    for letter in range(26):
+        if letters >> letter & 1:
+            if rack_bits >> letter & 1:
+                choices |= 1 << (2 * letter)
+            if blanks > 0:
+                choices |= 1 << (2 * letter + 1)
+    return choices
+
+
+@njit(cache=True)
+def _lowest_bit(bits):
+    """Returns the index of the lowest set bit of a non-zero integer."""
+    index = 0
+    while not bits >> index & 1:
+        index += 1
+    return index
+
+
+@njit(cache=True)
+def _visit_right(
+    board,
+    cross_checks,
+    children,
+    terminal,
+    edges_masks,
+    row,
+    anchor_col,
+    col,
+    node,
+    rack_bits,
+    blanks,
+    placed_pos,
+    placed_tiles,
+    n_placed,
+    n_moves,
+    out_pos,
+    out_tiles,
+    out_lengths,
+):
+    """Records the move of the tiles placed so far if it is legal, and finds the tiles to try on the next square.
+
+    Returns the choices of the next square as described in :func:`_choices`, with bit :data:`_NEXT` set instead if the
+    square already has a tile that the tiles so far can be followed by, and the number of moves found so far.
+    """
+    # moves are only generated across, so the next tile can only go out of bounds past the last column
+    if col > 14:
+        # check if there is a tile placed from the anchor onwards and if it made a legal word
+        if col > anchor_col and terminal[node]:
+            n_moves = _record_move(placed_pos, placed_tiles, n_placed, n_moves, out_pos, out_tiles, out_lengths)
+        return 0, n_moves
+
+    idx = row * 15 + col
+    tile = board[idx]
+    if tile == EMPTY:
+        if col > anchor_col and terminal[node]:
+            n_moves = _record_move(placed_pos, placed_tiles, n_placed, n_moves, out_pos, out_tiles, out_lengths)
+
+        if n_placed >= 7:
+            return 0, n_moves
+
+        # continuations from the current node that are legal on the square and that the rack can provide
+        available = rack_bits
+        if blanks > 0:
+            available = ALL_LETTERS_MASK
+        return _choices(edges_masks[node] & cross_checks[idx] & available, rack_bits, blanks), n_moves
+
+    # if the current square already has a tile, continue searching if it has a legal continuation
+    if children[node, (tile - 65) % 32] != NO_NODE:  # blanks are lowercase but follow the same edges
+        return 1 << _NEXT, n_moves
+    return 0, n_moves
+
+
+@njit(cache=True)
+def _record_move(placed_pos, placed_tiles, n_placed, n_moves, out_pos, out_tiles, out_lengths):
+    """Writes the placed tiles to the next row of the output buffers if there is space, see :func:`generate_moves`."""
+    if n_moves < len(out_lengths):
+        for i in range(n_placed):
+            out_pos[n_moves, i] = placed_pos[i]
+            out_tiles[n_moves, i] = placed_tiles[i]
+        out_lengths[n_moves] = n_placed
+    return n_moves + 1
+
+
+@njit(cache=True)
+def _extend_right(
+    board,
+    cross_checks,
+    children,
+    terminal,
+    edges_masks,
+    rack_counts,
+    rack_bits,
+    blanks,
+    row,
+    anchor_col,
+    node,
+    placed_pos,
+    placed_tiles,
+    n_placed,
+    stack,
+    n_moves,
+    out_pos,
+    out_tiles,
+    out_lengths,
+):
+    """Records all moves formed by extending the tiles placed so far to the right from the anchor square, see
+    :meth:`scrabble.movegenerator.MoveGenerator._right_part`.
+
+    ``placed_pos[:n_placed]`` and ``placed_tiles[:n_placed]`` are the flat positions and codes of the tiles placed so
+    far, and ``stack`` is a scratch array of shape (16, 6). The search is depth-first, with row ``depth`` of the stack
+    holding the state at column ``anchor_col + depth``, as recursive functions cannot be cached by Numba. Returns the
+    number of moves found so far.
+    """
+    choices, n_moves = _visit_right(
+        board,
+        cross_checks,
+        children,
+        terminal,
+        edges_masks,
+        row,
+        anchor_col,
+        anchor_col,
+        node,
+        rack_bits,
+        blanks,
+        placed_pos,
+        placed_tiles,
+        n_placed,
+        n_moves,
+        out_pos,
+        out_tiles,
+        out_lengths,
+    )
+    stack[0, _NODE] = node
+    stack[0, _CHOICES] = choices
+    stack[0, _RACK_BITS] = rack_bits
+    stack[0, _BLANKS] = blanks
+    stack[0, _LENGTH] = n_placed
+    stack[0, _USED] = -1
+
+    depth = 0
+    while depth >= 0:
+        choices = stack[depth, _CHOICES]
+
+        # all tiles have been tried, return the rack tile used to reach this square
+        if choices == 0:
+            if stack[depth, _USED] >= 0:
+                rack_counts[stack[depth, _USED]] += 1
+            depth -= 1
+            continue
+
+        choice = _lowest_bit(choices)
+        stack[depth, _CHOICES] = choices ^ (1 << choice)
+        node = stack[depth, _NODE]
+        rack_bits = stack[depth, _RACK_BITS]
+        blanks = stack[depth, _BLANKS]
+        n_placed = stack[depth, _LENGTH]
+        used = -1
+
+        idx = row * 15 + anchor_col + depth
+        if choice == _NEXT:
+            node = children[node, (board[idx] - 65) % 32]
+        else:
+            letter = choice >> 1
+            node = children[node, letter]
+            placed_pos[n_placed] = idx
+
+            # if a blank can be used, force its usage
+            if choice & 1:
+                placed_tiles[n_placed] = 97 + letter
+                blanks -= 1
+
+            # place tile if it is legal and not a blank
+            else:
+                placed_tiles[n_placed] = 65 + letter
+                rack_counts[letter] -= 1
+                if rack_counts[letter] == 0:
+                    rack_bits &= ~(1 << letter)
+                used = letter
+            n_placed += 1
+
+        depth += 1
+        choices, n_moves = _visit_right(
+            board,
+            cross_checks,
+            children,
+            terminal,
+            edges_masks,
+            row,
+            anchor_col,
+            anchor_col + depth,
+            node,
+            rack_bits,
+            blanks,
+            placed_pos,
+            placed_tiles,
+            n_placed,
+            n_moves,
+            out_pos,
+            out_tiles,
+            out_lengths,
+        )
+        stack[depth, _NODE] = node
+        stack[depth, _CHOICES] = choices
+        stack[depth, _RACK_BITS] = rack_bits
+        stack[depth, _BLANKS] = blanks
+        stack[depth, _LENGTH] = n_placed
+        stack[depth, _USED] = used
+
+    return n_moves
+
+
+@njit(cache=True)
+def _extend_left(
+    board,
+    cross_checks,
+    children,
+    terminal,
+    edges_masks,
+    rack_counts,
+    rack_bits,
+    blanks,
+    row,
+    anchor_col,
+    limit,
+    placed_pos,
+    placed_tiles,
+    left_stack,
+    right_stack,
+    n_moves,
+    out_pos,
+    out_tiles,
+    out_lengths,
+):
+    """Records all moves formed by each left-part of at most ``limit`` tiles that ends before the anchor square, see
+    :meth:`scrabble.movegenerator.MoveGenerator._left_part`.
+
+    ``left_stack`` is a scratch array of shape (8, 6), with row ``depth`` holding the state of the left-parts of
+    ``depth`` tiles, and ``right_stack`` is the scratch array handed to :func:`_extend_right`. Returns the number of
+    moves found so far.
+    """
+    left_stack[0, _NODE] = ROOT
+    left_stack[0, _RACK_BITS] = rack_bits
+    left_stack[0, _BLANKS] = blanks
+    left_stack[0, _USED] = -1
+
+    depth = 0
+    visit = True
+    while depth >= 0:
+        node = left_stack[depth, _NODE]
+        rack_bits = left_stack[depth, _RACK_BITS]
+        blanks = left_stack[depth, _BLANKS]
+
+        # extend each left-part from the anchor square once when it is first reached
+        if visit:
+            visit = False
+            for i in range(depth):
+                placed_pos[i] = row * 15 + anchor_col - depth + i
+            n_moves = _extend_right(
+                board,
+                cross_checks,
+                children,
+                terminal,
+                edges_masks,
+                rack_counts,
+                rack_bits,
+                blanks,
+                row,
+                anchor_col,
+                node,
+                placed_pos,
+                placed_tiles,
+                depth,
+                right_stack,
+                n_moves,
+                out_pos,
+                out_tiles,
+                out_lengths,
+            )
+
+            choices = 0
+            if depth < limit:
+                available = rack_bits
+                if blanks > 0:
+                    available = ALL_LETTERS_MASK
+                choices = _choices(edges_masks[node] & available, rack_bits, blanks)
+            left_stack[depth, _CHOICES] = choices
+
+        choices = left_stack[depth, _CHOICES]
+
+        # all tiles have been tried, return the rack tile used to reach this left-part
+        if choices == 0:
+            if left_stack[depth, _USED] >= 0:
+                rack_counts[left_stack[depth, _USED]] += 1
+            depth -= 1
+            continue
+
+        choice = _lowest_bit(choices)
+        left_stack[depth, _CHOICES] = choices ^ (1 << choice)
+        letter = choice >> 1
+        used = -1
+
+        # if a blank is in the rack, force its usage
+        if choice & 1:
+            placed_tiles[depth] = 97 + letter
+            blanks -= 1
+
+        # place a legal non-blank tile
+        else:
+            placed_tiles[depth] = 65 + letter
+            rack_counts[letter] -= 1
+            if rack_counts[letter] == 0:
+                rack_bits &= ~(1 << letter)
+            used = letter
+
+        depth += 1
+        left_stack[depth, _NODE] = children[node, letter]
+        left_stack[depth, _RACK_BITS] = rack_bits
+        left_stack[depth, _BLANKS] = blanks
+        left_stack[depth, _USED] = used
+        visit = True
+
+    return n_moves
+
+
+@njit(cache=True)
+def generate_moves(
+    board, cross_checks, anchors, children, terminal, edges_masks, rack_counts, blanks, out_pos, out_tiles, out_lengths
+):
+    """Finds all legal across moves, see :meth:`scrabble.movegenerator.MoveGenerator.calc_all_moves`.
+
+    Parameters
+    ----------
+    board : ndarray
+        Flat board buffer of tile codes.
+    cross_checks : ndarray
+        Letter set bitmask of the letters that are legal on each square for across moves, indexed by flat position.
+    anchors : ndarray
+        Flat positions of the anchor squares, in the order moves should be generated in.
+    children, terminal, edges_masks : ndarray
+        Dictionary arrays from :meth:`scrabble.dictionary.Tree.to_arrays`.
+    rack_counts : ndarray
+        Number of tiles of each letter index in the rack. It is changed while moves are searched for, but has its
+        original values again when the function returns.
+    blanks : int
+        Number of blanks in the rack.
+    out_pos, out_tiles : ndarray
+        2D arrays of shape (maximum number of moves, 7) that are filled with the flat positions and codes of the tiles
+        placed by each move, in the order they are placed in.
+    out_lengths : ndarray
+        1D array that is filled with the number of tiles placed by each move.
+
+    Returns
+    -------
+    int
+        Total number of moves found. If it is more than the length of ``out_lengths``, only the first moves were written
+        and the search should be repeated with larger buffers.
+    """
+    is_anchor = np.zeros(225, dtype=np.bool_)
+    for idx in anchors:
+        is_anchor[idx] = True
+
+    rack_bits = 0
+    for letter in range(26):
+        if rack_counts[letter] > 0:
+            rack_bits |= 1 << letter
+
+    placed_pos = np.zeros(7, dtype=np.int64)
+    placed_tiles = np.zeros(7, dtype=np.int64)
+    left_stack = np.zeros((8, 6), dtype=np.int64)
+    right_stack = np.zeros((16, 6), dtype=np.int64)
+    n_moves = 0
+    for anchor in anchors:
+        row, col = anchor // 15, anchor % 15
+
+        # count the empty squares to the left of the anchor that are not anchors themselves
+        limit = 0
+        while col - limit > 0 and not is_anchor[anchor - limit - 1] and board[anchor - limit - 1] == EMPTY:
+            limit += 1
+
+        # if there is space for a left-part, generate it
+        if limit > 0:
+            n_moves = _extend_left(
+                board,
+                cross_checks,
+                children,
+                terminal,
+                edges_masks,
+                rack_counts,
+                rack_bits,
+                blanks,
+                row,
+                col,
+                min(limit, 6),
+                placed_pos,
+                placed_tiles,
+                left_stack,
+                right_stack,
+                n_moves,
+                out_pos,
+                out_tiles,
+                out_lengths,
+            )
+
+        # if there no space for a left-part, follow all tiles to the left of the main anchor square
+        else:
+            start = col
+            while start > 0 and board[anchor - col + start - 1] != EMPTY:
+                start -= 1
+            node = ROOT
+            for left_col in range(start, col):
+                node = children[node, (board[anchor - col + left_col] - 65) % 32]
+                if node == NO_NODE:
+                    break
+
+            if node != NO_NODE:
+                n_moves = _extend_right(
+                    board,
+                    cross_checks,
+                    children,
+                    terminal,
+                    edges_masks,
+                    rack_counts,
+                    rack_bits,
+                    blanks,
+                    row,
+                    col,
+                    node,
+                    placed_pos,
+                    placed_tiles,
+                    0,
+                    right_stack,
+                    n_moves,
+                    out_pos,
+                    out_tiles,
+                    out_lengths,
+                )
+
+    return n_moves
@@ -1,12 +1,38 @@
 from __future__ import annotations
 
-from typing import Callable, Iterator
+import sys
+from functools import lru_cache
+from typing import Iterable, Iterator
 
 import numpy as np
 import numpy.typing as npt
 
 import scrabble.rules as rules
-from scrabble.primitives import Move, Position, PositionUtils
+from scrabble._fast import cross_sums, score_move, score_moves, word_spans
+from scrabble.dictionary import ALL_LETTERS_MASK, NO_NODE, ROOT, Tree
+from scrabble.primitives import EMPTY, POSITIONS, Move, Position, PositionUtils
+
+_EMPTY_BOARD = bytes([EMPTY]) * 225
+
+# conversions between tiles and the codes stored in the board buffer, only used at the str API boundary
+_TILE_STR = tuple(" " if code == EMPTY else chr(code) for code in range(128))
+_TILE_CODE = {tile: code for code, tile in enumerate(_TILE_STR) if code != ord(" ")}
+_DISPLAY_TABLE = bytes.maketrans(bytes([EMPTY]), b" ")
+
+# flat position of the square each flat position is moved to by transposing the board
+_TRANSPOSED_IDX = tuple((idx % 15) * 15 + idx // 15 for idx in range(225))
+
+# random bitstring for every tile ASCII code on every square, used to hash board states incrementally
+# empty squares hash to 0 so that an empty board has a hash of 0
+_zobrist_table = np.random.default_rng(0).integers(0, 2**63, size=(225, 128), dtype=np.uint64)
+_zobrist_table[:, EMPTY] = 0
+ZOBRIST_TABLE: list[list[int]] = _zobrist_table.tolist()  # python ints are much faster to xor than numpy scalars
+del _zobrist_table
+
+# transposition table of cross-word sums found by Board._cross_sums, shared by all boards as the sums only depend on the
+# tiles on the board. Slots are picked by the board hash and always replaced, so the table never grows
+CROSS_SUMS_TABLE_SIZE = 256  # must be a power of 2
+_cross_sums_table: list[tuple[int, bytearray] | None] = [None] * (CROSS_SUMS_TABLE_SIZE * 2)
 
 
 class Board:
@@ -17,11 +43,15 @@ class Board:
     * Lowercase chars represent a blank used as a tile with that letter.
     * " " represent no tiles have been placed on the square.
 
+    Internally the tiles are stored as their ASCII codes in a flat 225-byte buffer in row-major order, so a square at
+    position (row, col) is found at index ``row * 15 + col``. Squares with no tiles are stored as
+    :data:`scrabble.primitives.EMPTY`.
+
     Attributes
     ----------
     board
-    board_string : str
-        A string representing the structure of the board, used by :ref:`display` to interpolating tiles into the string.
+    zobrist_hash
+    cross_checks
     DL_COLOR : str
         The escape code for the colour of the double letter tile, used by :ref:`display`.
     TL_COLOR : str
@@ -32,35 +62,70 @@ class Board:
         The escape code for the colour of the triple word tile, used by :ref:`display`.
     """
 
-    board_string: str
     DL_COLOR = "\x1b[46m"
     TL_COLOR = "\x1b[44m"
     DW_COLOR = "\x1b[43m"
     TW_COLOR = "\x1b[41m"
 
-    def __init__(self, board: npt.NDArray[np.unicode_] | None = None) -> None:
+    def __init__(self, board: bytearray | None = None) -> None:
         """Initialises an empty board.
 
         Parameters
         ----------
-        board : ndarray, optional
-            15x15 2D list of tiles to initialise the board with.
+        board : bytearray, optional
+            Flat 225-byte buffer of tile codes to initialise the board with.
         """
         if board is None:
-            self._board = np.full((15, 15), " ", dtype=object)
+            self._board = bytearray(_EMPTY_BOARD)
+            self._zobrist = 0
         else:
             self._board = board
+            self._zobrist = 0
+            for idx, tile in enumerate(board):
+                self._zobrist ^= ZOBRIST_TABLE[idx][tile]
+        self._scratch = bytearray(15)  # reused by traverse_axis
+
+        # cross-check masks for down and across moves, only kept up to date once requested for a dictionary
+        self._dictionary: Tree | None = None
+        self._cross_checks: list[list[int]] = []
 
     @property
-    def board(self) -> npt.NDArray[np.unicode_]:
+    def board(self) -> npt.NDArray[np.uint8]:
         """Returns the board.
 
         Returns
         -------
         ndarray
-            15x15 2D list of tiles.
+            15x15 2D array of tile codes. The array is a view of the board buffer, not a copy, and should not be
+            written to or else :ref:`zobrist_hash` will go out of date.
+        """
+        return np.frombuffer(self._board, dtype=np.uint8).reshape(15, 15)
+
+    @property
+    def zobrist_hash(self) -> int:
+        """Returns the Zobrist hash of the board.
+
+        The hash is updated incrementally whenever a tile is placed or removed, so boards with the same tiles on the
+        same squares have the same hash regardless of the order the tiles were placed in.
+
+        Returns
+        -------
+        int
+            64-bit hash of the tiles on the board.
         """
-        return self._board
+        return self._zobrist
+
+    @property
+    def occupied_positions(self) -> list[Position]:
+        """Returns the positions of all squares with a tile placed on them.
+
+        Returns
+        -------
+        list[position]
+            Position of each occupied square, in order of flat position.
+        """
+        board = self._board
+        return [POSITIONS[idx] for idx in range(225) if board[idx] != EMPTY]
 
     def get_square(self, pos: Position) -> str:
         """Gets the tile placed at the given square position.
@@ -75,7 +140,24 @@ class Board:
         str
             A tile.
         """
-        return self._board[pos]
+        return _TILE_STR[self._board[pos[0] * 15 + pos[1]]]
+
+    def get_square_int(self, pos: Position) -> int:
+        """Gets the code of the tile placed at the given square position.
+
+        Unlike :ref:`get_square`, no string is looked up, so this is cheaper on hot paths.
+
+        Parameters
+        ----------
+        pos : position
+            Position of the square to target.
+
+        Returns
+        -------
+        int
+            ASCII code of the tile, or :data:`scrabble.primitives.EMPTY` if no tile is placed on the square.
+        """
+        return self._board[pos[0] * 15 + pos[1]]
 
     def set_square(self, pos: Position, tile: str) -> None:
         """Sets the tile placed at a given square position.
@@ -87,20 +169,40 @@ class Board:
         tile : str
             Tile to place at position.
         """
-        self._board[pos] = tile
+        self.set_square_int(pos, _TILE_CODE[tile])
+
+    def set_square_int(self, pos: Position, new_tile: int) -> None:
+        """Sets the code of the tile placed at a given square position.
+
+        Parameters
+        ----------
+        pos : position
+            Position of the square to target.
+        new_tile : int
+            ASCII code of the tile to place at position, or :data:`scrabble.primitives.EMPTY` to remove the tile.
+        """
+        idx = pos[0] * 15 + pos[1]
+        self._zobrist ^= ZOBRIST_TABLE[idx][self._board[idx]] ^ ZOBRIST_TABLE[idx][new_tile]
+        self._board[idx] = new_tile
+        self._refresh_cross_checks((idx,))
 
     def make_move(self, move: Move):
         """Make a move on the board.
 
-        Moves should not be made before calling :ref:`get_words_formed` or else the mode made will be removed.
-
         Parameters
         ----------
         move : Move
             Move to make.
         """
-        for tile, pos in move.tiles:
-            self.set_square(pos, tile)
+        board = self._board
+        zobrist = self._zobrist
+        for tile, (row, col) in move.tiles:
+            idx = row * 15 + col
+            new_tile = _TILE_CODE[tile]
+            zobrist ^= ZOBRIST_TABLE[idx][board[idx]] ^ ZOBRIST_TABLE[idx][new_tile]
+            board[idx] = new_tile
+        self._zobrist = zobrist
+        self._refresh_cross_checks(row * 15 + col for _, (row, col) in move.tiles)
 
     def unmake_move(self, move: Move) -> None:
         """Removes a move from the board.
@@ -110,14 +212,128 @@ class Board:
         move : Move
             Move to remove.
         """
-        for _, pos in move.tiles:
-            self.set_square(pos, " ")
+        board = self._board
+        zobrist = self._zobrist
+        for _, (row, col) in move.tiles:
+            idx = row * 15 + col
+            zobrist ^= ZOBRIST_TABLE[idx][board[idx]]  # empty squares hash to 0
+            board[idx] = EMPTY
+        self._zobrist = zobrist
+        self._refresh_cross_checks(row * 15 + col for _, (row, col) in move.tiles)
+
+    def cross_checks(self, dictionary: Tree, across: bool) -> list[int]:
+        """Returns the letters that can be placed on each square without forming an invalid cross-word.
+
+        The cross-checks are found for the whole board the first time they are requested. After that, placing or removing
+        tiles only recalculates the squares whose cross-words could have changed, which are the squares themselves and
+        the empty squares at both ends of the tiles next to them.
+
+        Parameters
+        ----------
+        dictionary : Tree
+            Dictionary tree of all valid words.
+        across : bool
+            Whether the cross-checks are for generating across or down moves.
+
+        Returns
+        -------
+        list[int]
+            Letter set bitmask of each square indexed by flat position, with the bit of each letter index in
+            :data:`scrabble.dictionary.LETTERS` that is legal on the square set. Squares that do not form a cross-word
+            allow every letter, and squares with a tile on them allow none. The list is updated in place as the board
+            changes, so it should not be written to.
+        """
+        if self._dictionary is not dictionary:
+            self._dictionary = dictionary
+            self._cross_checks = [
+                [self._calc_cross_check(idx, axis) for idx in range(225)] for axis in ((0, 1), (1, 0))
+            ]
+        return self._cross_checks[across]
+
+    def _calc_cross_check(self, idx: int, axis: Position) -> int:
+        """Finds the letters that form a valid cross-word when placed on a square, see :ref:`cross_checks`.
+
+        The tiles before the square are followed in the dictionary once, then every edge from the node reached is tried
+        with the tiles after the square, instead of looking up the whole cross-word for each of the 26 letters.
+
+        Parameters
+        ----------
+        idx : int
+            Flat position of the square.
+        axis : position
+            Direction of the cross-word. (0, 1) is a row traversal, (1, 0) is a column traversal.
+
+        Returns
+        -------
+        int
+            Letter set bitmask of the square.
+        """
+        if self._board[idx] != EMPTY:
+            return 0
+
+        row, col = divmod(idx, 15)
+        tiles, start, end = self.traverse_axis((row, col), axis)
+        if end - start == 1:
+            return ALL_LETTERS_MASK  # no cross-word is formed
+
+        dictionary = self._dictionary
+        square = row * axis[0] + col * axis[1]
+        node = ROOT
+        for letter in tiles[start:square].decode():
+            node = dictionary.get_branch(node, letter)
+            if node == NO_NODE:
+                return 0
+        suffix = tiles[square + 1 : end].decode()
+
+        # walk the edges of the node by their letter set bitmask, so no list of edges is built for each cross-check
+        mask = 0
+        letters = dictionary.get_edges_mask(node)
+        branches = dictionary.get_branches(node)
+        while letters:
+            letter_bit = letters & -letters
+            letters ^= letter_bit
+            node = branches[letter_bit.bit_length() - 1]
+            for letter in suffix:
+                node = dictionary.get_branch(node, letter)
+                if node == NO_NODE:
+                    break
+            else:
+                if dictionary.is_terminal(node):
+                    mask |= letter_bit
+        return mask
+
+    def _refresh_cross_checks(self, squares: Iterable[int]) -> None:
+        """Recalculates the cross-checks affected by placing or removing tiles, see :ref:`cross_checks`.
+
+        Parameters
+        ----------
+        squares : Iterable[int]
+            Flat positions of the squares that tiles were placed on or removed from.
+        """
+        if self._dictionary is None:
+            return
+
+        board = self._board
+        squares = tuple(squares)
+        for masks, (d_row, d_col) in zip(self._cross_checks, ((0, 1), (1, 0))):
+            dirty = set(squares)
+            for idx in squares:
+                # the cross-words through the first empty squares on both sides change too
+                for sign in (-1, 1):
+                    row, col = idx // 15 + sign * d_row, idx % 15 + sign * d_col
+                    while 0 <= row <= 14 and 0 <= col <= 14 and board[row * 15 + col] != EMPTY:
+                        row += sign * d_row
+                        col += sign * d_col
+                    if 0 <= row <= 14 and 0 <= col <= 14:
+                        dirty.add(row * 15 + col)
+
+            for idx in dirty:
+                masks[idx] = self._calc_cross_check(idx, (d_row, d_col))
 
     def get_words_formed(self, move: Move) -> Iterator[Move]:
         """Returns all words formed by a single move.
 
-        Moves should be made with :ref:`make_move` only after calling this function or else the mode made will be
-        removed.
+        The move is read from an overlay instead of being made on the board, so the board is never modified.
 
         Args:
             move (Move): All tiles and their positions.
@@ -129,42 +345,66 @@ class Board:
         if len(move) <= 0:
             return
 
-        def stop_condition(curr_square: str, curr_pos: Position):
-            return curr_square == " " and curr_pos not in move.all_positions
+        placed, overlay = self._overlay(move)
+        for start_row, start_col, d_row, d_col, length in word_spans(self._board, overlay, placed, move.across):
+            yield self._word_at(overlay, start_row, start_col, d_row, d_col, length)
 
-        self.make_move(move)
+    @staticmethod
+    def _overlay(move: Move) -> tuple[bytes, bytearray]:
+        """Returns the tiles of a move in the form read by the kernels in :mod:`scrabble._fast`.
 
-        # find the original word
-        across = move.across
-        if across:
-            base_word = Move(
-                *self.traverse_axis_until_condition(move.tiles[0][1], (0, 1), stop_condition)
-            )  # search for base word horizontally
-        else:
-            base_word = Move(
-                *self.traverse_axis_until_condition(move.tiles[0][1], (1, 0), stop_condition)
-            )  # search for base word vertically
-        yield base_word
-
-        for _, pos in move.tiles:
-            if across:
-                tiles = list(
-                    self.traverse_axis_until_condition(pos, (1, 0), stop_condition)
-                )  # search for word vertically
-            else:
-                tiles = list(
-                    self.traverse_axis_until_condition(pos, (0, 1), stop_condition)
-                )  # search for word horizontally
+        Parameters
+        ----------
+        move : Move
+            All tiles and their positions.
+
+        Returns
+        -------
+        bytes
+            Flat positions of the tiles placed by the move.
+        bytearray
+            225-byte overlay buffer with the ASCII code of each placed tile at its flat position and 0 elsewhere.
+        """
+        placed, codes = move.packed()
+        overlay = bytearray(225)
+        for idx, code in zip(placed, codes):
+            overlay[idx] = code
+        return placed, overlay
+
+    def _word_at(self, overlay: bytearray, start_row: int, start_col: int, d_row: int, d_col: int, length: int) -> Move:
+        """Returns the tiles of a word found by :func:`scrabble._fast.word_spans`.
 
-            # words are at least 2 letters long
-            if len(tiles) > 1:
-                yield Move(*tiles)
+        Parameters
+        ----------
+        overlay : bytearray
+            Overlay buffer of the tiles placed by a move.
+        start_row, start_col : int
+            Position of the first tile of the word.
+        d_row, d_col : int
+            Direction of the word.
+        length : int
+            Number of tiles in the word.
 
-        self.unmake_move(move)
+        Returns
+        -------
+        Move
+            All tiles of the word and their positions.
+        """
+        board = self._board
+        tiles: list[tuple[str, Position]] = []
+        row, col = start_row, start_col
+        for _ in range(length):
+            idx = row * 15 + col
+            tiles.append((_TILE_STR[overlay[idx] or board[idx]], (row, col)))
+            row += d_row
+            col += d_col
+        return Move(*tiles)
 
     def calc_score(self, move: Move) -> int:
         """Calculates the score for a move.
 
+        The move is read from an overlay instead of being made on the board, so the board is never modified.
+
         Parameters
         ----------
         move : Move
@@ -175,43 +415,97 @@ class Board:
         int
             The total score of the move.
         """
-        total_score = 0
-
-        # calculate score of each word formed
-        for word in self.get_words_formed(move):
-            score = 0
-            word_multiplier = 1
-
-            # loop through each letter
-            for tile, pos in word.tiles:
-                # letter score and letter bonus
-                letter_multiplier = 1
-                if pos in move.all_positions:  # make sure current tile newly-placed
-                    if pos in rules.DL:
-                        letter_multiplier = 2
-                    elif pos in rules.TL:
-                        letter_multiplier = 3
-                score += rules.TILE_VALUE.get(tile, 0) * letter_multiplier
-
-                # word bonus
-                if pos in move.all_positions:  # make sure current tile newly-placed
-                    if pos in rules.DW:
-                        word_multiplier *= 2
-                    elif pos in rules.TW:
-                        word_multiplier *= 3
-
-            score *= word_multiplier
-            total_score += score
-
-        # 7-letter bonus
-        if len(move.tiles) == 7:
-            total_score += 50
-
-        return total_score
+        placed, overlay = self._overlay(move)
+        return score_move(
+            self._board,
+            overlay,
+            placed,
+            move.across,
+            self._cross_sums(move.across),
+            rules.LETTER_MULT,
+            rules.WORD_MULT,
+            rules.TILE_VALUE_LUT,
+        )
+
+    def calc_scores_batch(self, moves: list[Move]) -> npt.NDArray[np.int64]:
+        """Calculates the scores for many moves at once.
+
+        All moves are packed into flat buffers and scored by a single kernel call, which saves the per-move overhead of
+        calling :ref:`calc_score` for every move.
+
+        Parameters
+        ----------
+        moves : list[Move]
+            All moves to score.
+
+        Returns
+        -------
+        ndarray
+            1D array of the total score of each move.
+        """
+        placed = bytearray()
+        tiles = bytearray()
+        offsets = [0]
+        across = bytearray(len(moves))
+        for i, move in enumerate(moves):
+            move_placed, move_tiles = move.packed()
+            placed += move_placed
+            tiles += move_tiles
+            offsets.append(len(placed))
+            across[i] = move.across
+
+        scores = np.zeros(len(moves), dtype=np.int64)
+        score_moves(
+            self._board,
+            bytearray(225),
+            bytes(placed),
+            bytes(tiles),
+            np.array(offsets, dtype=np.int64),
+            bytes(across),
+            self._cross_sums(True),
+            self._cross_sums(False),
+            rules.LETTER_MULT,
+            rules.WORD_MULT,
+            rules.TILE_VALUE_LUT,
+            scores,
+        )
+        return scores
+
+    def _cross_sums(self, across: bool) -> bytearray:
+        """Returns the sums of existing tile values in the cross-words of the board, see :func:`scrabble._fast.cross_sums`.
+
+        The sums are cached in a transposition table keyed by :ref:`zobrist_hash`, as every move scored on the same board
+        shares them, and boards reached again e.g. by undoing and redoing moves can reuse them too.
+
+        Parameters
+        ----------
+        across : bool
+            Whether the sums are for scoring an across or a down move.
+
+        Returns
+        -------
+        bytearray
+            Cross-word sum of each square.
+        """
+        slot = (self._zobrist & (CROSS_SUMS_TABLE_SIZE - 1)) * 2 + across
+        cached = _cross_sums_table[slot]
+        if cached is not None and cached[0] == self._zobrist:
+            return cached[1]
+
+        sums = bytearray(225)
+        if across:
+            cross_sums(self._board, 1, 0, rules.TILE_VALUE_LUT, sums)  # cross-words of across moves are vertical
+        else:
+            cross_sums(self._board, 0, 1, rules.TILE_VALUE_LUT, sums)
+        _cross_sums_table[slot] = (self._zobrist, sums)
+        return sums
 
     def clear(self) -> None:
         """Clears the board of all tiles."""
-        self._board = np.full((15, 15), " ", dtype=object)
+        self._board[:] = _EMPTY_BOARD  # overwrite in place rather than allocating a new buffer
+        self._zobrist = 0
+        for masks in self._cross_checks:
+            masks[:] = [ALL_LETTERS_MASK] * 225  # in place, as the lists are handed out by cross_checks
 
     def copy(self) -> Board:
         """Returns a copy of the board.
@@ -221,7 +515,12 @@ class Board:
         Board
             A copy of the board.
         """
-        return Board(np.copy(self._board))
+        board = Board()
+        board._board[:] = self._board
+        board._zobrist = self._zobrist  # no need to rehash the copied tiles
+        board._dictionary = self._dictionary
+        board._cross_checks = [masks.copy() for masks in self._cross_checks]
+        return board
 
     def transpose(self) -> Board:
         """Returns a copy of the board transposed.
@@ -231,121 +530,60 @@ class Board:
         Board
             A copy of the board with all the coordinates transposed.
         """
-        return Board(np.transpose(self._board))
-
-    def traverse_until_condition(
-        self,
-        start: Position,
-        direction: Position,
-        stop_condition: Callable[[str, Position], bool],
-    ) -> Iterator[tuple[str, Position]]:
-        """Traverses the board in the given direction.
+        board = Board(bytearray(self.board.T.tobytes()))
 
-        Iterates through squares on the board by incrementing its position by the direction, until it is out of bounds
-        or a condition is fufilled.
+        # cross-words along rows become cross-words along columns, so the cross-checks carry over transposed
+        board._dictionary = self._dictionary
+        board._cross_checks = [[masks[idx] for idx in _TRANSPOSED_IDX] for masks in reversed(self._cross_checks)]
+        return board
 
-        Parameters
-        ----------
-        start : position
-            Starting position of the traversal.
-        direction : position
-            Direction of the traversal.
-        stop_condition : Callable[[str, position], bool]
-            Stop condition. Takes in the current tile and position. If the return value is true, the traversal is
-            terminated.
-
-        Yields
-        ------
-        str
-            Traversed tile.
-        position
-            Position of the traversed tile.
-        """
-        current_pos = start
-        while True:
-            # stop traversal if out of bounds
-            current_pos = PositionUtils.add_pos(current_pos, direction)
-            if PositionUtils.out_of_bounds(current_pos):
-                break
-
-            # stop traversal if condition is satisfied
-            current_square = self.get_square(current_pos)
-            if stop_condition(current_square, current_pos):
-                break
-
-            yield current_square, current_pos
-
-    def traverse_axis_until_condition(
-        self,
-        pos: Position,
-        axis: Position,
-        stop_condition: Callable[[str, Position], bool],
-    ) -> Iterator[tuple[str, Position]]:
-        """Traverses the board bidirectionally in the given direction.
-
-        Iterates through squares on the board by first decrementing its position by the direction until it is out of
-        bounds or a condition is fufilled, then incrementing.
+    def traverse_axis(self, pos: Position, axis: Position) -> tuple[bytearray, int, int]:
+        """Finds the tiles on both sides of a square along an axis, until an empty square is reached on both ends.
 
         Parameters
         ----------
         pos : position
-            Starting position of the traversal.
+            Position of the square to start the traversal from.
         axis : position
-            Direction of the traversal. (1, 0) is a row traversal, (0, 1) is a column traversal.
-        stop_condition : Callable[[str, position], bool]
-            Stop condition. Takes in the current tile and position. If the return value is true, the traversal of one
-            direction is terminated.
+            Direction of the traversal. (0, 1) is a row traversal, (1, 0) is a column traversal.
 
-        Yields
-        ------
-        str
-            Traversed tile.
-        position
-            Position of the traversed tile.
-
-        Notes
-        -----
-        The yield value includes the starting tile and position of the traversal.
-        """
-        # front part
-        for item in list(self.traverse_until_condition(pos, (-axis[0], -axis[1]), stop_condition))[::-1]:
-            yield item
-        yield self.get_square(pos), pos  # middle letter
-        yield from self.traverse_until_condition(pos, axis, stop_condition)  # end part
-
-    def traverse_axis_until_empty(
-        self,
-        pos: Position,
-        axis: Position,
-    ) -> Iterator[tuple[str, Position]]:
-        """Traverses the board bidirectionally in the given direction until a blank is reached on both ends.
-
-        Iterates through squares on the board by first decrementing its position by the direction until it is out of
-        bounds or a blank square is encountered, then incrementing.
-
-        Parameters
-        ----------
-        pos : position
-            Starting position of the traversal.
-        axis : position
-            Direction of the traversal. (1, 0) is a row traversal, (0, 1) is a column traversal.
-
-        Yields
-        ------
-        str
-            Traversed tile.
-        position
-            Position of the traversed tile.
+        Returns
+        -------
+        bytearray
+            Scratch buffer of 15 tile codes indexed by the row or column index of each square along the axis. The
+            buffer is reused by every call, so it should be read before the next traversal.
+        int
+            Index in the buffer of the first tile found.
+        int
+            Index in the buffer after the last tile found.
 
         Notes
         -----
-        The yield value includes the starting tile and position of the traversal.
+        The tiles found include the tile on the starting square, even when it is empty.
         """
-        yield from self.traverse_axis_until_condition(
-            pos,
-            axis,
-            lambda tile, _: tile == " ",
-        )
+        board = self._board
+        buffer = self._scratch
+        row, col = pos
+        step = axis[0] * 15 + axis[1]  # distance between neighbouring squares along the axis in the board buffer
+
+        # front part, filled in backwards so that the tiles never need reversing
+        flat_pos = row * 15 + col
+        start = end = row * axis[0] + col * axis[1]
+        buffer[start] = board[flat_pos]
+        while start > 0 and board[flat_pos - step] != EMPTY:
+            flat_pos -= step
+            start -= 1
+            buffer[start] = board[flat_pos]
+
+        # end part
+        flat_pos = row * 15 + col
+        end += 1
+        while end < 15 and board[flat_pos + step] != EMPTY:
+            flat_pos += step
+            buffer[end] = board[flat_pos]
+            end += 1
+
+        return buffer, start, end
 
     def display(self, *args: tuple[str, Position]):
         """Print a text-based representation of the board.
@@ -355,35 +593,54 @@ class Board:
         *args : tuple[str, position]
             Character and its position to be added to the board display.
         """
-        contents = self._board.flatten()
-
-        for char, pos in args:
-            contents[PositionUtils.flat_pos(pos)] = char
-
-        print(board_string.format(*contents))
-
-
-# build board display debug string
-SQUARE_STRING = f"{{}} {{{{}}}} \x1b[49m "
-
-board_string = ""
-board_string += "   " + "  ".join(str(i).rjust(2) for i in range(15)) + "\n"
-for rowIdx in range(15):
-    board_string += str(rowIdx).rjust(2) + " "
-    board_string += SQUARE_STRING * 15
-    board_string += "\n\n"
-board_string = board_string.rstrip()
-
-# insert color into board display string
-colors = ["\x1b[100m" for _ in range(15 * 15)]
-for row, col in rules.DL:
-    colors[PositionUtils.flat_pos((row, col))] = Board.DL_COLOR
-for row, col in rules.TL:
-    colors[PositionUtils.flat_pos((row, col))] = Board.TL_COLOR
-for row, col in rules.DW:
-    colors[PositionUtils.flat_pos((row, col))] = Board.DW_COLOR
-for row, col in rules.TW:
-    colors[PositionUtils.flat_pos((row, col))] = Board.TW_COLOR
-board_string = board_string.format(*colors)
-
-Board.board_string = board_string
+        contents = list(self._board.translate(_DISPLAY_TABLE).decode())
+
+        for char, (row, col) in args:
+            contents[row * 15 + col] = char
+
+        # escape codes are only useful when printing to a terminal
+        segments = _get_board_segments(sys.stdout.isatty())
+        print("".join(segment + tile for segment, tile in zip(segments, contents)) + segments[-1])
+
+
+@lru_cache(maxsize=2)
+def _get_board_segments(color: bool) -> tuple[str, ...]:
+    """Builds the string representing the structure of the board, used by :ref:`Board.display`.
+
+    The string is only built the first time the board is displayed, instead of every time the module is imported. It is
+    split around the position of each tile so that displaying the board is a join instead of parsing a format string.
+
+    Parameters
+    ----------
+    color : bool
+        Whether to colour the bonus squares with escape codes.
+
+    Returns
+    -------
+    tuple[str, ...]
+        The 226 segments of the board display string that go before, between and after the tile of each square.
+    """
+    square_string = "{} {{}} \x1b[49m " if color else " {}  "
+
+    board_string = ""
+    board_string += "   " + "  ".join(str(i).rjust(2) for i in range(15)) + "\n"
+    for rowIdx in range(15):
+        board_string += str(rowIdx).rjust(2) + " "
+        board_string += square_string * 15
+        board_string += "\n\n"
+    board_string = board_string.rstrip()
+
+    if not color:
+        return tuple(board_string.split("{}"))
+
+    # insert color into board display string
+    colors = ["\x1b[100m" for _ in range(15 * 15)]
+    for row, col in rules.DL:
+        colors[PositionUtils.flat_pos((row, col))] = Board.DL_COLOR
+    for row, col in rules.TL:
+        colors[PositionUtils.flat_pos((row, col))] = Board.TL_COLOR
+    for row, col in rules.DW:
+        colors[PositionUtils.flat_pos((row, col))] = Board.DW_COLOR
+    for row, col in rules.TW:
+        colors[PositionUtils.flat_pos((row, col))] = Board.TW_COLOR
+    return tuple(board_string.format(*colors).split("{}"))
@@ -1,128 +1,310 @@
 from __future__ import annotations
 
-import pickle
+import numpy as np
+import numpy.typing as npt
 
+LETTERS = "ABCDEFGHIJKLMNOPQRSTUVWXYZ"  # edge letter for each letter index
+LETTER_INDEX = {letter: i for i, letter in enumerate(LETTERS)} | {
+    letter.lower(): i for i, letter in enumerate(LETTERS)
+}  # blanks are lowercase but follow the same edges
+ALL_LETTERS_MASK = (1 << len(LETTERS)) - 1  # letter set bitmask with the bit of every letter index set
+ROOT = 0  # node id of the root node
+NO_NODE = -1  # child node id stored for edges that do not exist
 
-class Node:
-    """A node in a Tree connecting to multiple branch nodes by letter-labeled edges.
+
+class Tree:
+    """A tree with nodes and connecting edges that represent an entire dictionary.
+
+    Nodes are referred to by integer ids, and the tree is stored as parallel arrays indexed by node id instead of a
+    graph of node objects. Trees built by :ref:`build_from_list` are minimised so that equivalent subtrees are shared,
+    which makes the tree a directed acyclic word graph where a node can have more than one parent.
+
+    Nodes only have a few edges each, so the edges are saved in compressed sparse row form: the edges of node ``node``
+    are at indices ``row_ptr[node]`` to ``row_ptr[node + 1]`` of the edge arrays, sorted by letter. This is only the
+    storage format, lookups go through a dense table rebuilt from these arrays when the tree is initialised.
 
     Attributes
     ----------
-    branch_nodes : dict[str, Node]
-        Mapping of edge letter to node connecting to edge.
-    terminal : bool
-        Whether the edges of the node from the root node makes up a valid word.
+    row_ptr : ndarray
+        1D array of the index of the first edge of each node, followed by the total number of edges.
+    edge_letters : ndarray
+        1D array of the letter index in :data:`LETTERS` of each edge.
+    edge_children : ndarray
+        1D array of the id of the node each edge leads to.
+    terminal : ndarray
+        1D array of whether the edges from the root node to each node make up a valid word.
     """
 
-    def __init__(self) -> None:
-        """Initialises an new node with no branches."""
-        self.branch_nodes: dict[str, Node] = {}
-        self.terminal = False  # if a node is a terminal node, the word formed by the letter edges is a valid word
-
-    def add_branch(self, edge: str, node: Node):
-        """Add a branch node and the edge that it connects to.
+    def __init__(
+        self,
+        row_ptr: npt.NDArray[np.int32],
+        edge_letters: npt.NDArray[np.uint8],
+        edge_children: npt.NDArray[np.int32],
+        terminal: npt.NDArray[np.bool_],
+    ) -> None:
+        """Initialise a tree from its node and edge arrays.
 
         Parameters
         ----------
-        edge : str
-            Single-character string to represent the edge that when followed leads to the branch node.
-        node : Node
-            Branch node connected by the edge.
+        row_ptr : ndarray
+            Index of the first edge of each node, see :ref:`row_ptr`.
+        edge_letters : ndarray
+            Letter index of each edge, see :ref:`edge_letters`.
+        edge_children : ndarray
+            Node id each edge leads to, see :ref:`edge_children`.
+        terminal : ndarray
+            Whether each node is a terminal node, see :ref:`terminal`.
         """
-        edge = edge.upper()
-        if self.branch_nodes.get(edge) is not None:
-            raise ValueError(f"Edge '{edge}' already exists.")
-        self.branch_nodes[edge] = node
+        self.row_ptr = row_ptr
+        self.edge_letters = edge_letters
+        self.edge_children = edge_children
+        self.terminal = terminal
+
+        # the CSR arrays are only the storage format. in memory, following a single edge is a constant time lookup in a
+        # dense table of shape (number of nodes, 26), which is the one lookup table kept
+        children = np.full((len(terminal), 26), NO_NODE, dtype=np.int32)
+        children[np.repeat(np.arange(len(terminal)), np.diff(row_ptr)), edge_letters] = edge_children
+        self._children = children
+        self._terminal_list: list[bool] = terminal.tolist()
+
+        # letter set bitmask of the edges of each node, so edges can be filtered by letter sets with a single AND
+        self._edges_masks = np.zeros(len(terminal), dtype=np.int64)
+        np.bitwise_or.at(
+            self._edges_masks,
+            np.repeat(np.arange(len(terminal)), np.diff(row_ptr)),
+            np.left_shift(1, edge_letters.astype(np.int64)),
+        )
+
+        # the move generator follows edges one at a time, and indexing numpy arrays from python is slow as every element
+        # is boxed into a numpy scalar. memoryviews of the same arrays return python ints without copying them
+        self._branches = memoryview(children.reshape(-1))
+        self._edges_masks_view = memoryview(self._edges_masks)
 
-    def get_branch(self, edge: str) -> Node | None:
-        """Get a branch node by following the edge it connects to.
+    @staticmethod
+    def build_from_list(word_list: list[str]) -> Tree:
+        """Build the tree from list of all valid words.
 
         Parameters
         ----------
-        edge : str
-            Single-character string.
+        word_list : list[str]
+            All valid words.
 
         Returns
         -------
-        Node | None
-            Branch node found, or None if no such branch exists.
+        Tree
+            Tree created.
         """
-        return self.branch_nodes.get(edge.upper())
+        # build dictionary tree, allocating node ids in the order nodes are created
+        children = [[NO_NODE] * 26]
+        terminal = [False]
+        for word in word_list:
+            current_node = ROOT
+
+            for letter in word.upper():
+                row = children[current_node]
+                next_node = row[LETTER_INDEX[letter]]
+                if next_node == NO_NODE:
+                    next_node = len(children)
+                    children.append([NO_NODE] * 26)
+                    terminal.append(False)
+                    row[LETTER_INDEX[letter]] = next_node
+                current_node = next_node
 
+            terminal[current_node] = True
 
-class Tree:
-    """A tree with nodes and connecting edges that represent an entire dictionary."""
+        children, terminal = Tree._minimise(children, terminal)
+
+        # pack the edges of each node in order of node id then letter
+        dense_children = np.array(children, dtype=np.int32)
+        has_edge = dense_children != NO_NODE
+        nodes, letters = np.nonzero(has_edge)
+        row_ptr = np.zeros(len(children) + 1, dtype=np.int32)
+        np.cumsum(np.count_nonzero(has_edge, axis=1), out=row_ptr[1:])
+        return Tree(
+            row_ptr,
+            letters.astype(np.uint8),
+            dense_children[nodes, letters],
+            np.array(terminal, dtype=np.bool_),
+        )
 
-    def __init__(self, root_node: Node) -> None:
-        """Initialise a tree with the given root node.
+    @staticmethod
+    def _minimise(children: list[list[int]], terminal: list[bool]) -> tuple[list[list[int]], list[bool]]:
+        """Merge equivalent subtrees of a trie, turning it into a minimal directed acyclic word graph.
+
+        Two nodes are equivalent if they are both terminal or both not, and their edges lead to equivalent nodes. Words
+        share many suffixes (e.g. -ING, -ED, -S) so this removes most of the nodes in the trie, while lookups work
+        exactly the same.
 
         Parameters
         ----------
-        root_node : Node
-            Root node.
+        children : list[list[int]]
+            Child node ids of each node of the trie. Child nodes must have larger ids than their parent nodes.
+        terminal : list[bool]
+            Whether each node of the trie is a terminal node.
+
+        Returns
+        -------
+        list[list[int]]
+            Child node ids of each node of the minimised graph.
+        list[bool]
+            Whether each node of the minimised graph is a terminal node.
         """
-        self.root_node = root_node
+        # intern nodes bottom-up, so the children of a node are always merged before the node itself
+        canonical_ids: dict[tuple[bool, tuple[int, ...]], int] = {}
+        merged_ids = [NO_NODE] * len(children)
+        merged_children: list[tuple[int, ...]] = []
+        merged_terminal: list[bool] = []
+        for node in reversed(range(len(children))):
+            row = tuple(child if child == NO_NODE else merged_ids[child] for child in children[node])
+            key = (terminal[node], row)
+            merged_id = canonical_ids.get(key)
+            if merged_id is None:
+                merged_id = len(merged_children)
+                canonical_ids[key] = merged_id
+                merged_children.append(row)
+                merged_terminal.append(terminal[node])
+            merged_ids[node] = merged_id
+
+        # the root node is interned last, reverse the ids so that it is the first node again
+        last_id = len(merged_children) - 1
+        return (
+            [[child if child == NO_NODE else last_id - child for child in row] for row in reversed(merged_children)],
+            merged_terminal[::-1],
+        )
 
     @staticmethod
-    def build_from_list(word_list: list[str]) -> Tree:
-        """Build the tree from list of all valid words.
+    def build_from_save(filepath: str) -> Tree:
+        """Build the tree from a .npz file.
 
         Parameters
         ----------
-        word_list : list[str]
-            All valid words.
+        filepath : str
+            Filepath to .npz file.
 
         Returns
         -------
         Tree
             Tree created.
         """
-        # build dictionary tree
-        root_node = Node()
-        for word in word_list:
-            current_node = root_node
+        with np.load(filepath) as data:
+            return Tree(data["row_ptr"], data["edge_letters"], data["edge_children"], data["terminal"])
 
-            for letter in word:
-                next_node = current_node.get_branch(letter)
-                if not next_node:
-                    next_node = Node()
-                    current_node.add_branch(letter, next_node)
-                current_node = next_node
+    def save(self, filepath: str):
+        """Save the tree as a .npz file.
 
-            current_node.terminal = True
+        Parameters
+        ----------
+        filepath : str
+            Filepath of .npz file.
+        """
+        np.savez_compressed(
+            filepath,
+            row_ptr=self.row_ptr,
+            edge_letters=self.edge_letters,
+            edge_children=self.edge_children,
+            terminal=self.terminal,
+        )
 
-        return Tree(root_node)
+    def to_arrays(self) -> tuple[npt.NDArray[np.int32], npt.NDArray[np.bool_], npt.NDArray[np.int64]]:
+        """Returns the tree as dense arrays indexed by node id, for walking it in compiled code.
 
-    @staticmethod
-    def build_from_save(filepath: str) -> Tree:
-        """Build the tree from a .pickle file.
+        Returns
+        -------
+        ndarray
+            2D array of shape (number of nodes, 26) of the id of the branch node connected by the edge of each letter in
+            :data:`LETTERS`, or :data:`NO_NODE` if no such branch exists.
+        ndarray
+            1D array of whether each node is a terminal node.
+        ndarray
+            1D array of the letter set bitmask of the edges of each node, see :ref:`get_edges_mask`.
+        """
+        return self._children, self.terminal, self._edges_masks
+
+    def get_branch(self, node: int, edge: str) -> int:
+        """Get a branch node by following the edge it connects to.
 
         Parameters
         ----------
-        filepath : str
-            Filepath to .pickle file.
+        node : int
+            Id of the node to follow the edge from.
+        edge : str
+            Single-character string.
 
         Returns
         -------
-        Tree
-            Tree created.
+        int
+            Id of the branch node found, or :data:`NO_NODE` if no such branch exists.
         """
-        with open(filepath, "rb") as f:
-            root_node = pickle.load(f)
-        return Tree(root_node)
+        return self._branches[node * 26 + LETTER_INDEX[edge]]
 
-    def save(self, filepath: str):
-        """Save the tree as a .pickle file.
+    def get_branches(self, node: int) -> memoryview:
+        """Get the branch nodes of a node by letter index.
 
         Parameters
         ----------
-        filepath : str
-            Filepath of .pickle file.
+        node : int
+            Id of the node.
+
+        Returns
+        -------
+        memoryview
+            Id of the branch node connected by the edge of each letter in :data:`LETTERS`, or :data:`NO_NODE` if no such
+            branch exists. The view should not be written to.
+        """
+        return self._branches[node * 26 : node * 26 + 26]
+
+    def get_edges(self, node: int) -> list[tuple[str, int]]:
+        """Get all edges of a node and the branch nodes they connect to.
+
+        Parameters
+        ----------
+        node : int
+            Id of the node.
+
+        Returns
+        -------
+        list[tuple[str, int]]
+            Edge letter and id of the branch node of each edge, sorted by letter.
+        """
+        start, end = self.row_ptr[node : node + 2].tolist()
+        return list(
+            zip(
+                [LETTERS[letter] for letter in self.edge_letters[start:end].tolist()],
+                self.edge_children[start:end].tolist(),
+            )
+        )
+
+    def get_edges_mask(self, node: int) -> int:
+        """Get the letters of all edges of a node.
+
+        Parameters
+        ----------
+        node : int
+            Id of the node.
+
+        Returns
+        -------
+        int
+            Letter set bitmask with the bit of the letter index of each edge set.
+        """
+        return self._edges_masks_view[node]
+
+    def is_terminal(self, node: int) -> bool:
+        """Check if the edges from the root node to a node make up a valid word.
+
+        Parameters
+        ----------
+        node : int
+            Id of the node.
+
+        Returns
+        -------
+        bool
+            Whether the node is a terminal node.
         """
-        with open(filepath, "wb") as f:
-            pickle.dump(self.root_node, f)
+        return self._terminal_list[node]
 
-    def get_node(self, path: str) -> Node:
+    def get_node(self, path: str) -> int:
         """Get a node given the edges to the node, starting from the root node.
 
         Parameters
@@ -132,23 +314,23 @@ class Tree:
 
         Returns
         -------
-        Node | None
-            Branch node found, or None if no such branch exists.
+        int
+            Id of the node found.
 
         Raises
         ------
         KeyError
             If path to node cannot be found.
         """
-        current_node = self.root_node
-        for letter in path.upper():
-            next_node = current_node.get_branch(letter)
-            if not next_node:
+        branches = self._branches
+        current_node = ROOT
+        for letter in path:
+            current_node = branches[current_node * 26 + LETTER_INDEX[letter]]
+            if current_node == NO_NODE:
                 raise KeyError(f"Path '{path}' to node does not exist")
-            current_node = next_node
         return current_node
 
-    def lookup(self, word: str) -> Node | None:
+    def lookup(self, word: str) -> bool:
         """Check if a word exists in the tree.
 
         Checks if the letters in the word form a valid edge path and the branch node found is a terminal node.
@@ -160,19 +342,17 @@ class Tree:
 
         Returns
         -------
-        Node | None
-            Branch node found by following the edges of the word, or None if no such branch exists.
+        bool
+            Whether the word is valid.
         """
         try:
-            found_node = self.get_node(word.upper())
-            if found_node.terminal:
-                return found_node
+            return self._terminal_list[self.get_node(word)]
         except KeyError:
-            pass
+            return False
 
 
 if __name__ == "__main__":
     with open("assets/CSW21.txt", "r") as f:
         word_list = f.read().split()
     d = Tree.build_from_list(word_list)
-    d.save("assets/CSW21.pickle")
+    d.save("assets/CSW21.npz")
@@ -2,28 +2,19 @@ from typing import Iterator
 
 import numpy as np
 import numpy.typing as npt
-from scipy.signal import convolve2d
 
+from scrabble._fast import HAVE_NUMBA, generate_moves
 from scrabble.board import Board
-from scrabble.dictionary import Node, Tree
-from scrabble.primitives import Move, Position, PositionUtils
+from scrabble.dictionary import ALL_LETTERS_MASK, LETTER_INDEX, LETTERS, NO_NODE, ROOT, Tree
+from scrabble.primitives import EMPTY, POSITIONS, Move, Placed, Position
+
+MOVE_BUFFER_SIZE = 4096  # number of moves the compiled move generator has space for at first, grown when needed
+_TRANSPOSE_TABLE = bytes(idx % 15 * 15 + idx // 15 for idx in range(225)) + bytes(31)  # for bytes.translate()
 
 
 class MoveGenerator:
     """Class responsible for generating all possible moves on the board."""
 
-    CROSS_CHECK_KERNEL = [
-        [0, 1, 0],
-        [0, 0, 0],
-        [0, 1, 0],
-    ]
-
-    ANCHOR_KERNEL = [
-        [0, 1, 0],
-        [1, 0, 1],
-        [0, 1, 0],
-    ]
-
     def __init__(self, board: Board, dictionary: Tree):
         """Initialises the MoveGenerator
 
@@ -36,48 +27,17 @@ class MoveGenerator:
         """
         self._board = board
         self._dictionary = dictionary
-
-    def _calc_cross_check(self, board: Board) -> npt.NDArray[np.unicode_]:
-        """Calculate all tiles that can be placed on each square of the board that forms a valid word vertically when
-        placed. Only generates vertical cross-checks.
-
-        Parameters
-        ----------
-        board : Board
-            Board to be used for cross-check set generation.
-
-        Returns
-        -------
-        ndarray
-            2D array of strings of all valid tiles that can be placed on each square.
-        """
-        cross_check = np.full((15, 15), "ABCDEFGHIJKLMNOPQRSTUVWXYZ", dtype="<U26")
-
-        # calculate number of neighbouring placed tiles each empty square has
-        convolved = convolve2d(board.board != " ", self.CROSS_CHECK_KERNEL, mode="same")
-        convolved *= board.board == " "
-        for pos in zip(*np.where(convolved >= 1)):
-            cross_check[pos] = ""
-
-            for letter in "ABCDEFGHIJKLMNOPQRSTUVWXYZ":
-                board.set_square(pos, letter)
-                word, _ = zip(*board.traverse_axis_until_empty(pos, (1, 0)))
-                word = "".join(word)
-                board.set_square(pos, " ")
-
-                if len(word) > 1:
-                    if self._dictionary.lookup(word):
-                        cross_check[pos] += letter
-
-        return cross_check
+        self._move_buffers = self._allocate_move_buffers(MOVE_BUFFER_SIZE)
 
     def _left_part(
         self,
-        rack: list[str],
+        rack_counts: list[int],
+        rack_mask: int,
+        blanks: int,
         partial_word: str,
-        current_node: Node,
+        current_node: int,
         limit: int,
-    ) -> Iterator[tuple[str, Node]]:
+    ) -> Iterator[tuple[str, int, int, int]]:
         """Generates all possible partial left-parts of a word.
 
         A left-part of a move is all tiles to the left of the main anchor square. The main anchor square is the first
@@ -85,14 +45,19 @@ class MoveGenerator:
 
         Parameters
         ----------
-        rack : list[str]
-            List of single-character strings that represent tiles that can be used. Blanks are represented by " ". This
-            list will be changed during the function runtime to simulate using up tiles, but the list will return back
-            to its original values when the function finishes running.
+        rack_counts : list[int]
+            Number of non-blank tiles of each letter index that can be used, see :ref:`_count_rack`. This list will be
+            changed during the function runtime to simulate using up tiles, but the list will return back to its
+            original values when the function finishes running.
+        rack_mask : int
+            Letter set bitmask of the letters with a non-zero count in ``rack_counts``.
+        blanks : int
+            Number of blanks that can be used.
         partial_word : str
             Partially constructed word for recursive function. Should be empty string for initial call.
-        current_node : Node
-            Current node of the partially constructed word for recursive function. Should be root node for initial call.
+        current_node : int
+            Id of the current node of the partially constructed word for recursive function. Should be the root node for
+            initial call.
         limit : int
             The maximum length of the left-part generated. Is also the maximum number of tiles that can be placed to the
             left of the main anchor square without overlapping another anchor square.
@@ -101,204 +66,450 @@ class MoveGenerator:
         ------
         str
             A possible left-part.
-        Node
-            The node that the left-part stops at.
+        int
+            Id of the node that the left-part stops at.
+        int
+            Letter set bitmask of the letters left in the rack after the left-part is placed.
+        int
+            Number of blanks left in the rack after the left-part is placed.
         """
-        yield partial_word, current_node
+        yield partial_word, current_node, rack_mask, blanks
 
         if limit > 0:
-            for edge, node in current_node.branch_nodes.items():
+            # only follow the edges of letters the rack can provide, in order of letter index
+            letters = self._dictionary.get_edges_mask(current_node) & (ALL_LETTERS_MASK if blanks else rack_mask)
+            branches = self._dictionary.get_branches(current_node)
+            while letters:
+                letter_bit = letters & -letters
+                letters ^= letter_bit
+                index = letter_bit.bit_length() - 1
+                edge = LETTERS[index]
+                node = branches[index]
+
                 # place a legal non-blank tile
-                if edge in rack:
-                    rack.remove(edge)
-                    yield from self._left_part(rack, partial_word + edge, node, limit - 1)
-                    rack.append(edge)
+                if rack_mask & letter_bit:
+                    rack_counts[index] -= 1
+                    yield from self._left_part(
+                        rack_counts,
+                        rack_mask if rack_counts[index] else rack_mask ^ letter_bit,
+                        blanks,
+                        partial_word + edge,
+                        node,
+                        limit - 1,
+                    )
+                    rack_counts[index] += 1
 
                 # if a blank is in the rack, force its usage
-                if " " in rack:
-                    rack.remove(" ")
-                    yield from self._left_part(rack, partial_word + edge.lower(), node, limit - 1)
-                    rack.append(" ")
+                if blanks:
+                    yield from self._left_part(
+                        rack_counts, rack_mask, blanks - 1, partial_word + edge.lower(), node, limit - 1
+                    )
 
     def _right_part(
         self,
-        board: Board,
-        rack: list[str],
+        tiles: list[int],
+        rack_counts: list[int],
+        rack_mask: int,
+        blanks: int,
         main_anchor_pos: Position,
         main_anchor_index: int,
-        cross_check: npt.NDArray[np.unicode_],
+        cross_check: list[int],
         partial_word: str,
-        current_node: Node,
-        current_pos: Position,
+        current_node: int,
+        idx: int,
+        step: int,
+        end: int,
         placed: Move,
-    ) -> Iterator[Move]:
-        """Generates all possible moves that can be formed at a position by extending a left-part. Only generates across
-        moves.
+    ) -> Iterator[Placed]:
+        """Generates all possible moves that can be formed at a position by extending a left-part. Only generates moves
+        along a single row or column.
 
         Parameters
         ----------
-        board : Board
-            Current board.
-        rack : list[str]
-            List of single-character strings that represent tiles that can be used. Blanks are represented by " ". This
-            list will be changed during the function runtime to simulate using up tiles, but the list will return back
-            to its original values when the function finishes running.
+        tiles : list[int]
+            Tile code of each square of the current board, indexed by flat position.
+        rack_counts : list[int]
+            Number of non-blank tiles of each letter index that can be used, see :ref:`_count_rack`. This list will be
+            changed during the function runtime to simulate using up tiles, but the list will return back to its
+            original values when the function finishes running.
+        rack_mask : int
+            Letter set bitmask of the letters with a non-zero count in ``rack_counts``.
+        blanks : int
+            Number of blanks that can be used.
         main_anchor_pos : position
             The position of the main anchor square, which is the first anchor square that the move overlaps.
         main_anchor_index : int
             The index of the tile on the main anchor square in the partial word.
-        cross_check : ndarray
-            Cross-check set for the current board.
+        cross_check : list[int]
+            Cross-check letter set bitmask of each square of the current board, see :ref:`Board.cross_checks`.
         partial_word : str
             Partially constructed word for recursive function. Should be the left-part for initial call.
-        current_node : Node
-            Current node of the partially constructed word for recursive function. Should be the node that the left-part
-            stops at for initial call.
-        current_pos : position
-            Position of the next tile to be placed. Should be the main anchor square for initial call.
+        current_node : int
+            Id of the current node of the partially constructed word for recursive function. Should be the node that the
+            left-part stops at for initial call.
+        idx : int
+            Flat position of the next tile to be placed. Should be the main anchor square for initial call.
+        step : int
+            Difference in flat position between consecutive squares of the move, 1 for across moves and 15 for down
+            moves.
+        end : int
+            Flat position one step past the last square of the row or column, where the move goes out of bounds.
         placed : Move
             All tiles that have been currently placed. Should be all tiles of the left-part for initial call.
 
         Yields
         ------
-        Move
-            A legal move.
+        tuple[tuple[str, position], ...]
+            Tiles of a legal move and their positions. A tuple is yielded instead of a copy of ``placed``, so no move is
+            created until it is needed.
         """
-        if PositionUtils.out_of_bounds(current_pos):
+        # moves only go forwards along their row or column, so the next tile can only go out of bounds past its end
+        if idx >= end:
             # check if there is a previous tile placed and if it made a legal word
-            if len(partial_word) != main_anchor_index and current_node.terminal:
-                yield placed.copy()
+            if len(partial_word) != main_anchor_index and self._dictionary.is_terminal(current_node):
+                yield tuple(placed.tiles)
             return
 
-        current_tile = board.get_square(current_pos)
+        current_tile = tiles[idx]
         # if the current square is empty
-        if current_tile == " ":
+        if current_tile == EMPTY:
             # check if there is a previous tile placed and if it made a legal word
-            if len(partial_word) != main_anchor_index and current_node.terminal:
-                yield placed.copy()
+            if len(partial_word) != main_anchor_index and self._dictionary.is_terminal(current_node):
+                yield tuple(placed.tiles)
 
             if len(placed) >= 7:
                 return
 
-            # loop through all possible continuations from the current node
-            for edge, node in current_node.branch_nodes.items():
-                if edge in cross_check[current_pos]:
-                    # place tile if it is legal and not a blank
-                    if edge in rack:
-                        rack.remove(edge)
-                        placed += (edge, current_pos)  # type: ignore
-                        yield from self._right_part(
-                            board,
-                            rack,
-                            main_anchor_pos,
-                            main_anchor_index,
-                            cross_check,
-                            partial_word + edge,
-                            node,
-                            (current_pos[0], current_pos[1] + 1),
-                            placed,
-                        )
-                        rack.append(edge)
-                        placed -= (edge, current_pos)  # type: ignore
-
-                    # if a blank can be used, force its usage
-                    if " " in rack:
-                        rack.remove(" ")
-                        lowered_edge = edge.lower()
-                        placed += (lowered_edge, current_pos)  # type: ignore
-                        yield from self._right_part(
-                            board,
-                            rack,
-                            main_anchor_pos,
-                            main_anchor_index,
-                            cross_check,
-                            partial_word + lowered_edge,
-                            node,
-                            (current_pos[0], current_pos[1] + 1),
-                            placed,
-                        )
-                        rack.append(" ")
-                        placed -= (lowered_edge, current_pos)  # type: ignore
+            # loop through the continuations from the current node that are legal on the square and that the rack can
+            # provide, in order of letter index
+            letters = (
+                self._dictionary.get_edges_mask(current_node)
+                & cross_check[idx]
+                & (ALL_LETTERS_MASK if blanks else rack_mask)
+            )
+            branches = self._dictionary.get_branches(current_node)
+            while letters:
+                letter_bit = letters & -letters
+                letters ^= letter_bit
+                index = letter_bit.bit_length() - 1
+                edge = LETTERS[index]
+                node = branches[index]
+
+                # place tile if it is legal and not a blank
+                if rack_mask & letter_bit:
+                    rack_counts[index] -= 1
+                    placed.push(edge, POSITIONS[idx])
+                    yield from self._right_part(
+                        tiles,
+                        rack_counts,
+                        rack_mask if rack_counts[index] else rack_mask ^ letter_bit,
+                        blanks,
+                        main_anchor_pos,
+                        main_anchor_index,
+                        cross_check,
+                        partial_word + edge,
+                        node,
+                        idx + step,
+                        step,
+                        end,
+                        placed,
+                    )
+                    rack_counts[index] += 1
+                    placed.pop()
+
+                # if a blank can be used, force its usage
+                if blanks:
+                    lowered_edge = edge.lower()
+                    placed.push(lowered_edge, POSITIONS[idx])
+                    yield from self._right_part(
+                        tiles,
+                        rack_counts,
+                        rack_mask,
+                        blanks - 1,
+                        main_anchor_pos,
+                        main_anchor_index,
+                        cross_check,
+                        partial_word + lowered_edge,
+                        node,
+                        idx + step,
+                        step,
+                        end,
+                        placed,
+                    )
+                    placed.pop()
 
         # if the current square already has a tile
         else:
             # if the tile placed has a legal continuation from the current node, continue searching
-            node = current_node.get_branch(current_tile)
-            if node is not None:
+            node = self._dictionary.get_branches(current_node)[(current_tile - 65) % 32]  # blanks follow the same edges
+            if node != NO_NODE:
                 yield from self._right_part(
-                    board,
-                    rack,
+                    tiles,
+                    rack_counts,
+                    rack_mask,
+                    blanks,
                     main_anchor_pos,
                     main_anchor_index,
                     cross_check,
-                    partial_word + current_tile,
+                    partial_word + chr(current_tile),
                     node,
-                    (current_pos[0], current_pos[1] + 1),
+                    idx + step,
+                    step,
+                    end,
                     placed,
                 )
 
-    def _calc_all_across_moves(self, board: Board, rack: list[str]) -> Iterator[Move]:
-        cross_check = self._calc_cross_check(board)
-        convolved = convolve2d(board.board != " ", self.ANCHOR_KERNEL, mode="same")
-        convolved *= board.board == " "
-        anchors = list(zip(*np.where(convolved >= 1)))
+    @staticmethod
+    def _count_rack(rack: list[str]) -> tuple[list[int], int, int]:
+        """Counts the tiles in a rack, so tiles can be used up and returned by index instead of searching the rack.
+
+        Parameters
+        ----------
+        rack : list[str]
+            List of single-character strings that represent tiles that can be used. Blanks are represented by " ".
+
+        Returns
+        -------
+        list[int]
+            Number of non-blank tiles of each letter index.
+        int
+            Letter set bitmask of the letters with a non-zero count.
+        int
+            Number of blanks.
+        """
+        rack_counts = [0] * 26
+        rack_mask = 0
+        for tile in rack:
+            if tile != " ":
+                rack_counts[LETTER_INDEX[tile]] += 1
+                rack_mask |= 1 << LETTER_INDEX[tile]
+        return rack_counts, rack_mask, rack.count(" ")
+
+    def _calc_left_parts(
+        self, tiles: list[int], is_anchor: list[bool], across: bool
+    ) -> tuple[list[int], list[str], list[int]]:
+        """Finds what is to the left of every square of the board in a single sweep along each row.
+
+        For down moves, the sweep is along each column instead, and "to the left" means above.
+
+        Parameters
+        ----------
+        tiles : list[int]
+            Tile code of each square, indexed by flat position.
+        is_anchor : list[bool]
+            Whether each square is an anchor square, indexed by flat position.
+        across : bool
+            Whether the left-parts are for across or down moves.
+
+        Returns
+        -------
+        list[int]
+            Number of empty squares directly to the left of each square that are not anchors themselves, which is the
+            space for the left-part of a move with the square as its main anchor square.
+        list[str]
+            Tiles directly to the left of each square, up to the first empty square.
+        list[int]
+            Id of the node reached by following the tiles directly to the left of each square, or :data:`NO_NODE` if
+            they are not the start of any valid word.
+        """
+        limits = [0] * 225
+        prefixes = [""] * 225
+        prefix_nodes = [ROOT] * 225
+        step = 1 if across else 15
+        for line in range(15):
+            limit = 0
+            prefix = ""
+            node = ROOT
+            start = line * 15 if across else line
+            for idx in range(start, start + 15 * step, step):
+                limits[idx] = limit
+                prefixes[idx] = prefix
+                prefix_nodes[idx] = node
+
+                tile = tiles[idx]
+                if tile == EMPTY:
+                    limit = 0 if is_anchor[idx] else limit + 1
+                    prefix = ""
+                    node = ROOT
+                else:
+                    limit = 0
+                    prefix += chr(tile)
+                    if node != NO_NODE:
+                        node = self._dictionary.get_branches(node)[(tile - 65) % 32]  # blanks follow the same edges
+
+        return limits, prefixes, prefix_nodes
+
+    @staticmethod
+    def _calc_anchors(board: Board) -> npt.NDArray[np.bool_]:
+        """Finds the anchor squares of the board, which are the empty squares next to a placed tile.
+
+        Anchors do not depend on the direction of the move, so the anchors of the transposed board are the transpose of
+        the result.
+
+        Parameters
+        ----------
+        board : Board
+            Board to find the anchor squares of.
+
+        Returns
+        -------
+        ndarray
+            15x15 2D array of whether each square is an anchor square.
+        """
+        # shift the occupied squares in all 4 directions
+        occupied = board.board != EMPTY
+        has_neighbour = np.zeros((15, 15), dtype=np.bool_)
+        has_neighbour[1:] |= occupied[:-1]
+        has_neighbour[:-1] |= occupied[1:]
+        has_neighbour[:, 1:] |= occupied[:, :-1]
+        has_neighbour[:, :-1] |= occupied[:, 1:]
+        return has_neighbour & ~occupied
+
+    def _calc_all_moves_along(self, rack: list[str], is_anchor: npt.NDArray[np.bool_], across: bool) -> Iterator[Move]:
+        board = self._board
+        cross_check = board.cross_checks(self._dictionary, across)
+
+        # anchors are searched row by row for across moves, and column by column for down moves
+        lines, squares = np.nonzero(is_anchor if across else is_anchor.T)
+        anchors = (lines * 15 + squares if across else squares * 15 + lines).tolist()
 
         # if first move is not yet placed, the centre is the only anchor
         if not anchors:
-            anchors = [(7, 7)]
+            anchors = [7 * 15 + 7]
+
+        if HAVE_NUMBA:
+            yield from self._calc_all_moves_compiled(rack, cross_check, anchors, across)
+            return
+
+        # down moves walk the board along columns with a stride of 15, so the board does not need to be transposed
+        tiles = board.board.ravel().tolist()
+        rack_counts, rack_mask, blanks = self._count_rack(rack)
+        limits, prefixes, prefix_nodes = self._calc_left_parts(tiles, is_anchor.ravel().tolist(), across)
+        step = 1 if across else 15
+        for idx in anchors:
+            anchor = POSITIONS[idx]
+            end = idx - idx % 15 + 15 if across else idx % 15 + 225
+            limit = limits[idx]
 
-        for anchor in anchors:
-            limit = len(
-                list(
-                    board.traverse_until_condition(
-                        anchor,
-                        (0, -1),
-                        lambda _, pos: pos in anchors or board.get_square(pos) != " ",
-                    )
-                )
-            )
             # if there is space for a left-part, generate it
             if limit > 0:
-                for left_part, current_node in self._left_part(rack, "", self._dictionary.root_node, min(limit, 6)):
-                    yield from self._right_part(
-                        board,
-                        rack,
+                for left_part, current_node, left_mask, left_blanks in self._left_part(
+                    rack_counts, rack_mask, blanks, "", ROOT, min(limit, 6)
+                ):
+                    placed_tiles = self._right_part(
+                        tiles,
+                        rack_counts,
+                        left_mask,
+                        left_blanks,
                         anchor,
                         len(left_part),
                         cross_check,
                         left_part,
                         current_node,
-                        anchor,
-                        Move.anchored_to_moves(left_part, anchor, len(left_part)),
+                        idx,
+                        step,
+                        end,
+                        Move.anchored_to_moves(left_part, anchor, len(left_part), across),
                     )
-            # if there no space for a left-part, retrieve all tiles to the left of the main anchor square
-            else:
-                existing_left_part_tiles = Move(
-                    *board.traverse_until_condition(anchor, (0, -1), lambda tile, _: tile == " ")
+                    yield from map(Move.from_placed, placed_tiles)
+            # if there no space for a left-part, extend the tiles to the left of the main anchor square if they are valid
+            elif prefix_nodes[idx] != NO_NODE:
+                placed_tiles = self._right_part(
+                    tiles,
+                    rack_counts,
+                    rack_mask,
+                    blanks,
+                    anchor,
+                    len(prefixes[idx]),
+                    cross_check,
+                    prefixes[idx],
+                    prefix_nodes[idx],
+                    idx,
+                    step,
+                    end,
+                    Move(),
                 )
-                left_part = existing_left_part_tiles.get_word()
-                try:
-                    yield from self._right_part(
-                        board,
-                        rack,
-                        anchor,
-                        len(left_part),
-                        cross_check,
-                        left_part,
-                        self._dictionary.get_node(left_part),
-                        anchor,
-                        Move(),
-                    )
-                except KeyError:
-                    pass
+                yield from map(Move.from_placed, placed_tiles)
+
+    @staticmethod
+    def _allocate_move_buffers(size: int) -> tuple[npt.NDArray[np.uint8], npt.NDArray[np.uint8], npt.NDArray[np.uint8]]:
+        """Allocates the output buffers of :func:`scrabble._fast.generate_moves`.
+
+        Parameters
+        ----------
+        size : int
+            Maximum number of moves the buffers have space for.
+
+        Returns
+        -------
+        tuple[ndarray, ndarray, ndarray]
+            Flat positions of the tiles, codes of the tiles and number of tiles of each move.
+        """
+        return np.zeros((size, 7), dtype=np.uint8), np.zeros((size, 7), dtype=np.uint8), np.zeros(size, dtype=np.uint8)
+
+    def _calc_all_moves_compiled(
+        self, rack: list[str], cross_check: list[int], anchors: list[int], across: bool
+    ) -> Iterator[Move]:
+        """Generates all across or down moves with the compiled :func:`scrabble._fast.generate_moves`.
+
+        The moves are searched for in the same order as :ref:`_left_part` and :ref:`_right_part` do, so they are
+        generated in the same order too.
+
+        Parameters
+        ----------
+        rack : list[str]
+            List of single-character strings that represent tiles that can be used. Blanks are represented by " ".
+        cross_check : list[int]
+            Cross-check letter set bitmask of each square of the current board, see :ref:`Board.cross_checks`.
+        anchors : list[int]
+            Flat positions of all anchor squares.
+        across : bool
+            Whether to generate across or down moves.
+
+        Yields
+        ------
+        Move
+            A legal move, packed as the flat positions and codes of its tiles, see :ref:`Move.from_packed`.
+        """
+        # the compiled generator only searches along rows, so down moves are searched on a transposed copy of the arrays
+        tiles = self._board.board
+        cross_check_array = np.array(cross_check, dtype=np.int64)
+        anchors_array = np.array(anchors, dtype=np.int64)
+        if not across:
+            tiles = tiles.T
+            cross_check_array = cross_check_array.reshape(15, 15).T
+            anchors_array = anchors_array % 15 * 15 + anchors_array // 15
+
+        rack_counts, _, blanks = self._count_rack(rack)
+        args = (
+            tiles.ravel(),
+            cross_check_array.ravel(),
+            anchors_array,
+            *self._dictionary.to_arrays(),
+            np.array(rack_counts, dtype=np.int64),
+            blanks,
+        )
+        n_moves = generate_moves(*args, *self._move_buffers)
+        if n_moves > len(self._move_buffers[2]):
+            self._move_buffers = self._allocate_move_buffers(n_moves)
+            generate_moves(*args, *self._move_buffers)
+
+        # copy the buffers out before yielding, as they are reused by the next search. each move is sliced out of its row
+        # of 7 bytes, so no tiles are converted to python objects
+        out_pos, out_tiles, out_lengths = self._move_buffers
+        positions = out_pos[:n_moves].tobytes()
+        if not across:
+            positions = positions.translate(_TRANSPOSE_TABLE)
+        codes = out_tiles[:n_moves].tobytes()
+        for start, length in zip(range(0, n_moves * 7, 7), out_lengths[:n_moves].tolist()):
+            yield Move.from_packed(positions[start : start + length], codes[start : start + length])
 
     def calc_all_moves(self, rack: list[str]) -> Iterator[Move]:
-        # get all legal across moves
-        yield from self._calc_all_across_moves(self._board, rack)
+        is_anchor = self._calc_anchors(self._board)
 
-        # get all legal down moves
-        for move in self._calc_all_across_moves(self._board.transpose(), rack):
-            yield move.transpose()
+        # get all legal across moves, then all legal down moves
+        for across in (True, False):
+            yield from self._calc_all_moves_along(rack, is_anchor, across)
 
         # yield pass move
         yield Move()
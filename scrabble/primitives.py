@@ -1,8 +1,10 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-
 Position = tuple[int, int]
+Placed = tuple[tuple[str, Position], ...]  # tiles and their positions, as stored in Move.tiles
+
+EMPTY = 0  # code stored in the board buffer for squares with no tiles, tiles are stored as their ASCII codes
+POSITIONS = tuple((idx // 15, idx % 15) for idx in range(225))  # position of each flat position
 
 
 class PositionUtils:
@@ -63,11 +65,13 @@ class PositionUtils:
         return pos1[0] + pos2[0], pos1[1] + pos2[1]
 
 
-@dataclass
 class Move:
-    """A collection of tiles placed in a single line and their positions."""
+    """A collection of tiles placed in a single line and their positions.
 
-    tiles: list[tuple[str, Position]]
+    Moves can also be stored packed as the flat positions and codes of their tiles, see :ref:`from_packed`. Most
+    generated moves are only ever scored, which reads the packed form directly, so the list of tiles is not built until
+    it is first accessed.
+    """
 
     def __init__(self, *tiles: tuple[str, Position]) -> None:
         """Initialises a move with the given tiles and positions.
@@ -77,7 +81,48 @@ class Move:
         *args : tuple[str, position]
             Tile and its position on the board.
         """
-        self.tiles = list(tiles)
+        self._tiles: list[tuple[str, Position]] | None = list(tiles)
+        self._packed: tuple[bytes, bytes] | None = None  # only kept until the list of tiles is built
+        self._positions: set[Position] | None = None  # built on first access, then kept in step by += and -=
+
+    @property
+    def tiles(self) -> list[tuple[str, Position]]:
+        """All tiles and their positions.
+
+        Returns
+        -------
+        list[tuple[str, position]]
+            Tile and its position on the board of each tile. The list can be changed to change the move.
+        """
+        if self._tiles is None:
+            # the list can be changed in place from here on, so it becomes the only copy of the tiles
+            positions, codes = self._packed
+            self._tiles = [(" " if code == EMPTY else chr(code), POSITIONS[idx]) for idx, code in zip(positions, codes)]
+            self._packed = None
+        return self._tiles
+
+    @tiles.setter
+    def tiles(self, tiles: list[tuple[str, Position]]) -> None:
+        self._tiles = tiles
+        self._packed = None
+        self._positions = None
+
+    def packed(self) -> tuple[bytes, bytes]:
+        """Returns the tiles of the move packed into bytes, in the form read by the kernels in :mod:`scrabble._fast`.
+
+        Returns
+        -------
+        bytes
+            Flat position of each tile.
+        bytes
+            Code of each tile, which is its ASCII code or :data:`EMPTY` for " ".
+        """
+        if self._packed is not None:
+            return self._packed
+        return (
+            bytes(row * 15 + col for _, (row, col) in self._tiles),
+            bytes(EMPTY if tile == " " else ord(tile) for tile, _ in self._tiles),
+        )
 
     @property
     def across(self) -> bool:
@@ -88,18 +133,26 @@ class Move:
         bool
             True if across, False if down. Always True if only one tile is placed or if the move is a pass.
         """
+        if self._packed is not None:
+            positions = self._packed[0]
+            return len(positions) <= 1 or positions[0] // 15 == positions[1] // 15
         return len(self.tiles) <= 1 or self.tiles[0][1][0] == self.tiles[1][1][0]
 
     @property
-    def all_positions(self) -> list[Position]:
+    def all_positions(self) -> set[Position]:
         """All positions occupied by all the tiles.
 
+        The set is only built the first time it is accessed, as most moves (e.g. those generated by the move generator)
+        never need it. After that it is maintained as tiles are added and removed, so it is not rebuilt on every access.
+
         Returns
         -------
-        list[position]
+        set[position]
             Position of tile.
         """
-        return [pos for _, pos in self.tiles]
+        if self._positions is None:
+            self._positions = {pos for _, pos in self.tiles}
+        return self._positions
 
     def transpose(self) -> Move:
         """Returns a copy of the move with all tile positions transposed.
@@ -159,8 +212,51 @@ class Move:
         Move
             Copy of the move.
         """
+        if self._packed is not None:
+            return Move.from_packed(*self._packed)
         return Move(*self.tiles)
 
+    @staticmethod
+    def from_placed(placed: Placed | list[tuple[str, Position]]) -> Move:
+        """Creates a new Move object from tiles that are already collected together.
+
+        Unlike the constructor, the tiles are not unpacked into arguments first, so the list is copied only once.
+
+        Parameters
+        ----------
+        placed : tuple[tuple[str, position], ...] | list[tuple[str, position]]
+            Tiles and their positions on the board.
+
+        Returns
+        -------
+        Move
+            Move created.
+        """
+        move = Move()
+        move.tiles = list(placed)
+        return move
+
+    @staticmethod
+    def from_packed(positions: bytes, codes: bytes) -> Move:
+        """Creates a new Move object from tiles packed into bytes, see :ref:`packed`.
+
+        Parameters
+        ----------
+        positions : bytes
+            Flat position of each tile.
+        codes : bytes
+            Code of each tile.
+
+        Returns
+        -------
+        Move
+            Move created.
+        """
+        move = Move()
+        move._tiles = None
+        move._packed = (positions, codes)
+        return move
+
     @staticmethod
     def anchored_to_moves(
         word: str,
@@ -196,6 +292,35 @@ class Move:
 
         return Move(*tiles)
 
+    def push(self, tile: str, pos: Position) -> None:
+        """Places a tile at the end of the move.
+
+        Parameters
+        ----------
+        tile : str
+            Tile to place.
+        pos : position
+            Position of the tile.
+        """
+        self.tiles.append((tile, pos))
+        if self._positions is not None:
+            self._positions.add(pos)
+
+    def pop(self) -> tuple[str, Position]:
+        """Removes the tile placed last by :ref:`push`.
+
+        Unlike ``-=``, the tile does not need to be searched for, so tiles can be placed and removed like a stack.
+
+        Returns
+        -------
+        tuple[str, position]
+            Tile removed and its position.
+        """
+        tile = self.tiles.pop()
+        if self._positions is not None:
+            self._positions.discard(tile[1])
+        return tile
+
     def __add__(self, __value: tuple[str, Position]) -> Move:
         return Move(*(self.tiles + [__value]))
 
@@ -204,14 +329,28 @@ class Move:
 
     def __iadd__(self, __value: tuple[str, Position]) -> Move:
         self.tiles.append(__value)
+        if self._positions is not None:
+            self._positions.add(__value[1])
         return self
 
     def __isub__(self, __value: tuple[str, Position]) -> Move:
         self.tiles.remove(__value)
+        if self._positions is not None:
+            self._positions.discard(__value[1])
         return self
 
     def __len__(self) -> int:
+        if self._packed is not None:
+            return len(self._packed[0])
         return len(self.tiles)
 
+    def __eq__(self, __value: object) -> bool:
+        if not isinstance(__value, Move):
+            return NotImplemented
+        return self.tiles == __value.tiles
+
     def __hash__(self) -> int:
         return hash(tuple(self.tiles))
+
+    def __repr__(self) -> str:
+        return f"Move(tiles={self.tiles!r})"
@@ -12,7 +12,25 @@ TL = [tuple(item) for item in data["bonusSquares"]["tripleLetter"]]
 DW = [tuple(item) for item in data["bonusSquares"]["doubleWord"]]
 TW = [tuple(item) for item in data["bonusSquares"]["tripleWord"]]
 
+# letter and word multiplier of each square, indexed by flat position
+LETTER_MULT = bytearray([1] * 225)
+WORD_MULT = bytearray([1] * 225)
+for row, col in DL:
+    LETTER_MULT[row * 15 + col] = 2
+for row, col in TL:
+    LETTER_MULT[row * 15 + col] = 3
+for row, col in DW:
+    WORD_MULT[row * 15 + col] = 2
+for row, col in TW:
+    WORD_MULT[row * 15 + col] = 3
+LETTER_MULT = bytes(LETTER_MULT)
+WORD_MULT = bytes(WORD_MULT)
+
 TILE_VALUE = data["tileValue"]
+TILE_VALUE_LUT = bytearray(128)  # tile values indexed by ASCII code, blanks and empty squares are worth 0
+for tile, value in TILE_VALUE.items():
+    TILE_VALUE_LUT[ord(tile)] = value
+TILE_VALUE_LUT = bytes(TILE_VALUE_LUT)
 TILE_COUNT = data["tileCount"]
 TILE_POOL = []
 for tile, count in TILE_COUNT.items():
@@ -1,14 +1,20 @@
+from collections import OrderedDict
+
+import numpy as np
+
 from scrabble import rules
 from scrabble.board import Board
 from scrabble.dictionary import Tree
 from scrabble.movegenerator import MoveGenerator
 from scrabble.primitives import Move
 
+BEST_MOVES_SIZE = 64  # number of solved states remembered before the least recently used is forgotten
+
 
 class Solver:
     def __init__(self) -> None:
         self.board = Board()
-        self.dictionary = Tree.build_from_save("assets/CSW21.pickle")
+        self.dictionary = Tree.build_from_save("assets/CSW21.npz")
         self.move_generator = MoveGenerator(self.board, self.dictionary)
         self.rack: list[str] = []
         self.pool = rules.TILE_POOL[:]
@@ -20,3 +26,18 @@ class Solver:
         self.edits = Move()
         self.status_text = ""
         self.legal_check = True
+
+        # best computer move for the most recent (board hash, sorted rack) states seen, so repeated states e.g. after
+        # undo and redo are not solved again
+        self.best_moves: OrderedDict[tuple[int, tuple[str, ...]], Move] = OrderedDict()
+
+    def calc_best_move(self) -> Move:
+        key = (self.board.zobrist_hash, tuple(sorted(self.rack)))
+        if key in self.best_moves:
+            self.best_moves.move_to_end(key)
+        else:
+            moves = list(self.move_generator.calc_all_moves(self.rack))
+            self.best_moves[key] = moves[int(np.argmax(self.board.calc_scores_batch(moves)))]
+            if len(self.best_moves) > BEST_MOVES_SIZE:
+                self.best_moves.popitem(last=False)
+        return self.best_moves[key].copy()
@@ -1,9 +1,11 @@
+from functools import lru_cache
+from typing import Iterable
+
 import pygame
 from pygame import Rect
 
 from scrabble import rules
-from scrabble.board import Board
-from scrabble.primitives import Position
+from scrabble.primitives import POSITIONS, Position, PositionUtils
 from solver import Solver
 
 pygame.init()
@@ -22,6 +24,12 @@ DW_COLOR = "#d4908e"
 TW_COLOR = "#8f424b"
 BORDER_COLOR = "#d7c6c6"
 ARROW_BG_COLOR = "#ffffff"
+# kind of each square indexed by flat position: 0 for normal squares, then 1 to 4 for DL, TL, DW and TW squares
+SQUARE_KIND = bytes(
+    1 if pos in rules.DL else 2 if pos in rules.TL else 3 if pos in rules.DW else 4 if pos in rules.TW else 0
+    for pos in POSITIONS
+)
+KIND_TO_COLOR = [EMPTY_COLOR, DL_COLOR, TL_COLOR, DW_COLOR, TW_COLOR]
 
 EXISTING_TILE_PALETTE = {
     "tile": "#dfceb9",
@@ -44,13 +52,10 @@ EDIT_TILE_PALETTE = {
 
 # fonts
 TILE_FONT = pygame.font.Font("assets/Roboto-Bold.ttf", 26)
-BLANK_FONT = pygame.font.Font("assets/Roboto-Bold.ttf", 24)
 SCORE_FONT = pygame.font.Font("assets/Roboto-Black.ttf", 10)
 
-# images
-STAR_IMG = pygame.image.load("assets/star.png")
-ARROW_ACROSS_IMG = pygame.image.load("assets/arrow_across.png")
-ARROW_DOWN_IMG = pygame.image.load("assets/arrow_down.png")
+# composed tile surface for each (letter, id of palette), filled in as tiles are drawn
+TILE_SURFACES: dict[tuple[str, int], pygame.Surface] = {}
 
 # other
 TILE_ROUNDED_RADIUS = 6
@@ -69,273 +74,323 @@ TOOLBAR_H = 30
 TOOLBAR_BG_COLOR = "#06080a"
 TOOLBAR_ICON_PADDING = 6
 TOOLBAR_ICON_SIZE = TOOLBAR_H - TOOLBAR_ICON_PADDING * 2
+TOOLBAR_ICON_COLS = {"undo": 0, "redo": 1, "clear_edits": 2, "clear_all": 3}  # column of each left-aligned button
+
+### Status bar ###
+STATUS_BAR_H = 20
+STATUS_BAR_BG_COLOR = "#1f2933"
+STATUS_BAR_FONT = pygame.font.Font("assets/Roboto-Regular.ttf", 12)
+STATUS_BAR_FONT_COLOR = "#ffffff"
+STATUS_BAR_TEXT_PADDING_X = 8
+STATUS_BAR_TEXT_PADDING_Y = 2
+
+### Window ###
+WINDOW_SIZE = (BOARD_SIZE, TOOLBAR_H + BOARD_SIZE + RACK_H + STATUS_BAR_H)
+SCREEN = pygame.display.set_mode(WINDOW_SIZE)
+
+### Images ###
+# loaded after the window is created, so they can be converted to the pixel format of the screen and blitted without
+# converting every pixel on each blit
+STAR_IMG = pygame.image.load("assets/star.png").convert_alpha()
+ARROW_ACROSS_IMG = pygame.image.load("assets/arrow_across.png").convert_alpha()
+ARROW_DOWN_IMG = pygame.image.load("assets/arrow_down.png").convert_alpha()
 
-UNDO_IMG = pygame.transform.scale(pygame.image.load("assets/undo.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE))
-REDO_IMG = pygame.transform.scale(pygame.image.load("assets/redo.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE))
+UNDO_IMG = pygame.transform.scale(
+    pygame.image.load("assets/undo.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+)
+REDO_IMG = pygame.transform.scale(
+    pygame.image.load("assets/redo.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+)
 CLEAR_EDITS_IMG = pygame.transform.scale(
-    pygame.image.load("assets/clear_edits.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+    pygame.image.load("assets/clear_edits.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
 )
 CLEAR_ALL_IMG = pygame.transform.scale(
-    pygame.image.load("assets/clear_all.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+    pygame.image.load("assets/clear_all.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
 )
 LEGAL_CHECK_ON_IMG = pygame.transform.scale(
-    pygame.image.load("assets/legal_check_on.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+    pygame.image.load("assets/legal_check_on.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
 )
 LEGAL_CHECK_OFF_IMG = pygame.transform.scale(
-    pygame.image.load("assets/legal_check_off.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+    pygame.image.load("assets/legal_check_off.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
 )
 CALC_MOVE_IMG = pygame.transform.scale(
-    pygame.image.load("assets/calc_move.png"), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
+    pygame.image.load("assets/calc_move.png").convert_alpha(), (TOOLBAR_ICON_SIZE, TOOLBAR_ICON_SIZE)
 )
-TOOLBAR_ICON_ORDER = [UNDO_IMG, REDO_IMG, CLEAR_EDITS_IMG, CLEAR_ALL_IMG]
-
-### Status bar ###
-STATUS_BAR_H = 20
-STATUS_BAR_BG_COLOR = "#1f2933"
-STATUS_BAR_FONT = pygame.font.Font("assets/Roboto-Regular.ttf", 12)
-STATUS_BAR_FONT_COLOR = "#ffffff"
-STATUS_BAR_TEXT_PADDING_X = 8
-STATUS_BAR_TEXT_PADDING_Y = 2
 
 ### Dependent dimensions ###
-WINDOW_SIZE = (BOARD_SIZE, TOOLBAR_H + BOARD_SIZE + RACK_H + STATUS_BAR_H)
-SCREEN = pygame.display.set_mode(WINDOW_SIZE)
 BOARD_RECT = Rect(0, TOOLBAR_H, BOARD_SIZE, BOARD_SIZE)
 RACK_RECT = Rect(0, TOOLBAR_H + BOARD_SIZE, BOARD_SIZE, RACK_H)
 RACK_TILES_Y = TOOLBAR_H + BOARD_SIZE + (RACK_H - SQUARE_SIZE) // 2
+# x of each tile of a centred rack, indexed by number of tiles then tile index
+RACK_TILE_XS = [
+    [
+        (BOARD_SIZE - (n * (SQUARE_SIZE + RACK_TILES_PADDING) - RACK_TILES_PADDING)) // 2
+        + i * (SQUARE_SIZE + RACK_TILES_PADDING)
+        for i in range(n)
+    ]
+    for n in range(8)
+]
 TOOLBAR_RECT = Rect(0, 0, BOARD_SIZE, TOOLBAR_H)
 STATUS_BAR_RECT = Rect(0, TOOLBAR_H + BOARD_SIZE + RACK_H, BOARD_SIZE, STATUS_BAR_H)
-UNDO_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_ORDER.index(UNDO_IMG), 0, TOOLBAR_H, TOOLBAR_H)
-REDO_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_ORDER.index(REDO_IMG), 0, TOOLBAR_H, TOOLBAR_H)
-CLEAR_EDITS_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_ORDER.index(CLEAR_EDITS_IMG), 0, TOOLBAR_H, TOOLBAR_H)
-CLEAR_ALL_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_ORDER.index(CLEAR_ALL_IMG), 0, TOOLBAR_H, TOOLBAR_H)
+UNDO_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_COLS["undo"], 0, TOOLBAR_H, TOOLBAR_H)
+REDO_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_COLS["redo"], 0, TOOLBAR_H, TOOLBAR_H)
+CLEAR_EDITS_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_COLS["clear_edits"], 0, TOOLBAR_H, TOOLBAR_H)
+CLEAR_ALL_RECT = Rect(TOOLBAR_H * TOOLBAR_ICON_COLS["clear_all"], 0, TOOLBAR_H, TOOLBAR_H)
 LEGAL_CHECK_RECT = Rect(BOARD_SIZE - TOOLBAR_H * 2, 0, TOOLBAR_H, TOOLBAR_H)
 CALC_MOVE_RECT = Rect(BOARD_SIZE - TOOLBAR_H, 0, TOOLBAR_H, TOOLBAR_H)
 
+# top left corner of each square indexed by row then column, relative to the board and to the screen
+COORDS_TABLE = [[(col * SQUARE_SIZE, row * SQUARE_SIZE) for col in range(15)] for row in range(15)]
+COORDS_TABLE_Y_OFFSET = [[(col * SQUARE_SIZE, row * SQUARE_SIZE + TOOLBAR_H) for col in range(15)] for row in range(15)]
 
-def draw_board(solver: Solver):
-    pygame.draw.rect(SCREEN, BORDER_COLOR, BOARD_RECT)
-
-    for row in range(15):
-        for col in range(15):
-            square_pos = (row, col)
-            tile = solver.board.get_square(square_pos)
-
-            # draw squares
-            if tile == " " and square_pos not in solver.edits.all_positions:
-                if square_pos in rules.DL:
-                    square_color = DL_COLOR
-                elif square_pos in rules.TL:
-                    square_color = TL_COLOR
-                elif square_pos in rules.DW:
-                    square_color = DW_COLOR
-                elif square_pos in rules.TW:
-                    square_color = TW_COLOR
-                else:
-                    square_color = EMPTY_COLOR
-                draw_square(square_pos, square_color, (row, col) == (7, 7))
-
-            # draw tiles
-            else:
-                if square_pos in solver.last_move.all_positions:
-                    palette = RECENT_TILE_PALETTE
-                elif square_pos in solver.edits.all_positions:
-                    palette = EDIT_TILE_PALETTE
-                    tile = solver.edits.get_tile(square_pos)
-                else:
-                    palette = EXISTING_TILE_PALETTE
-                draw_tile(square_pos, tile, palette)
+# screen area of each square and of the inside of its border, indexed by row then column. these are shared, so they
+# should not be changed in place
+TILE_RECTS = [[Rect(x, y, SQUARE_SIZE, SQUARE_SIZE) for x, y in row] for row in COORDS_TABLE_Y_OFFSET]
+INNER_RECTS = [[rect.inflate(-BORDER_SIZE * 2, -BORDER_SIZE * 2) for rect in row] for row in TILE_RECTS]
 
 
-def draw_square(board_pos: Position, color: str, star: bool = False):
-    x, y = pos_to_coords(board_pos)
-    y += TOOLBAR_H
+def draw_board(solver: Solver, dirty: Iterable[Position] | None = None) -> list[Rect]:
+    # the empty squares never change, so they are copied from the pre-rendered background and only tiles are drawn
+    background = render_board_background()
 
-    # draw square
-    pygame.draw.rect(
-        SCREEN,
-        color,
-        Rect(
-            x + BORDER_SIZE,
-            y + BORDER_SIZE,
-            SQUARE_SIZE - BORDER_SIZE * 2,
-            SQUARE_SIZE - BORDER_SIZE * 2,
+    # look up what is drawn on each square once, rather than through the solver for every square. edits are mapped by
+    # position, which also saves searching them for the tile on each edited square
+    get_square = solver.board.get_square
+    edit_tiles = {pos: tile for tile, pos in solver.edits.tiles}
+    last_move_positions = solver.last_move.all_positions
+
+    # redraw the whole board unless only some squares are dirty
+    if dirty is None:
+        SCREEN.blit(background, BOARD_RECT)
+        squares = solver.board.occupied_positions + list(edit_tiles)
+        rects = [BOARD_RECT]
+    else:
+        squares = [square_pos for square_pos in dirty if not PositionUtils.out_of_bounds(square_pos)]
+        rects = [square_rect(square_pos) for square_pos in squares]
+        for rect in rects:
+            SCREEN.blit(background, rect, rect.move(0, -TOOLBAR_H))
+
+    # tiles are collected and blitted all at once, which saves the setup of each separate blit
+    tiles: list[tuple[pygame.Surface, Position]] = []
+    for square_pos in squares:
+        tile = get_square(square_pos)
+
+        # draw tiles
+        if tile != " " or square_pos in edit_tiles:
+            # tiles have rounded corners, so they go on a bare square
+            row, col = square_pos
+            pygame.draw.rect(SCREEN, BORDER_COLOR, TILE_RECTS[row][col])
+            if square_pos in last_move_positions:
+                palette = RECENT_TILE_PALETTE
+            elif square_pos in edit_tiles:
+                palette = EDIT_TILE_PALETTE
+                tile = edit_tiles[square_pos]
+            else:
+                palette = EXISTING_TILE_PALETTE
+            tiles.append((render_tile(tile, palette), COORDS_TABLE_Y_OFFSET[row][col]))
+    SCREEN.blits(tiles, doreturn=False)
+
+    return rects
+
+
+@lru_cache(maxsize=1)
+def render_board_background() -> pygame.Surface:
+    background = pygame.Surface((BOARD_SIZE, BOARD_SIZE)).convert()
+    background.fill(BORDER_COLOR)
+
+    # squares of the same kind all share one filled surface, so the inside of every square is drawn by a single blits
+    inner_size = SQUARE_SIZE - BORDER_SIZE * 2
+    square_surfaces = []
+    for color in KIND_TO_COLOR:
+        square_surface = pygame.Surface((inner_size, inner_size)).convert()
+        square_surface.fill(color)
+        square_surfaces.append(square_surface)
+    background.blits(
+        (
+            (square_surfaces[SQUARE_KIND[row * 15 + col]], (x + BORDER_SIZE, y + BORDER_SIZE))
+            for row, coords_row in enumerate(COORDS_TABLE)
+            for col, (x, y) in enumerate(coords_row)
         ),
+        doreturn=False,
     )
 
-    if star:
-        img_pos = STAR_IMG.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
-        SCREEN.blit(STAR_IMG, img_pos)
+    # draw star on the centre square
+    x, y = COORDS_TABLE[7][7]
+    img_pos = STAR_IMG.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
+    background.blit(STAR_IMG, img_pos)
+
+    return background
 
 
-def draw_tile(board_pos: Position, letter: str, palette: dict[str, str]):
-    x, y = pos_to_coords(board_pos)
-    y += TOOLBAR_H
+def render_tile(letter: str, palette: dict[str, str]) -> pygame.Surface:
+    # tiles only come in a few dozen letter/palette combinations, so compose each one once. palettes are module-level
+    # constants, so they can be told apart by id
+    key = (letter, id(palette))
+    if key in TILE_SURFACES:
+        return TILE_SURFACES[key]
 
+    tile = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
     pygame.draw.rect(
-        SCREEN,
+        tile,
         palette["tile"],
-        Rect(x, y, SQUARE_SIZE, SQUARE_SIZE),
+        Rect(0, 0, SQUARE_SIZE, SQUARE_SIZE),
         border_radius=TILE_ROUNDED_RADIUS,
     )
 
     # not a blank tile
     if letter.isupper():
         # draw letter
-        text = TILE_FONT.render(letter, True, palette["font"])
-        text_pos = text.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
-        SCREEN.blit(text, text_pos)
+        text = render_text(TILE_FONT, letter, palette["font"])
+        text_pos = text.get_rect(center=(SQUARE_SIZE // 2, SQUARE_SIZE // 2))
+        tile.blit(text, text_pos)
 
         # draw score
-        text = SCORE_FONT.render(str(rules.TILE_VALUE[letter]), True, palette["font"])
-        text_pos = text.get_rect(bottomright=(x + SQUARE_SIZE - SCORE_PADDING[0], y + SQUARE_SIZE - SCORE_PADDING[0]))
-        SCREEN.blit(text, text_pos)
+        text = render_text(SCORE_FONT, str(rules.TILE_VALUE[letter]), palette["font"])
+        text_pos = text.get_rect(bottomright=(SQUARE_SIZE - SCORE_PADDING[0], SQUARE_SIZE - SCORE_PADDING[0]))
+        tile.blit(text, text_pos)
 
     # blank tile
     else:
         # draw circle
         pygame.draw.circle(
-            SCREEN,
+            tile,
             palette["blank_circle"],
-            (x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2),
+            (SQUARE_SIZE // 2, SQUARE_SIZE // 2),
             BLANK_CIRCLE_RADIUS,
         )
 
         # draw tilted text
-        text = TILE_FONT.render(letter.upper(), True, palette["blank_font"])
+        text = render_text(TILE_FONT, letter.upper(), palette["blank_font"])
         text = pygame.transform.rotozoom(text, BLANK_LETTER_TILT, 1)
-        text_pos = text.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
-        SCREEN.blit(text, text_pos)
+        text_pos = text.get_rect(center=(SQUARE_SIZE // 2, SQUARE_SIZE // 2))
+        tile.blit(text, text_pos)
 
+    TILE_SURFACES[key] = tile
+    return tile
 
-def draw_arrow(board_pos: Position, across: bool):
-    x, y = pos_to_coords(board_pos)
-    y += TOOLBAR_H
 
-    pygame.draw.rect(
-        SCREEN,
-        ARROW_BG_COLOR,
-        Rect(
-            x + BORDER_SIZE,
-            y + BORDER_SIZE,
-            SQUARE_SIZE - BORDER_SIZE * 2,
-            SQUARE_SIZE - BORDER_SIZE * 2,
-        ),
-    )
+def draw_arrow(board_pos: Position, across: bool) -> Rect:
+    # the lookup tables only cover the board, and an arrow past the edge is not drawn
+    if PositionUtils.out_of_bounds(board_pos):
+        return Rect(0, 0, 0, 0)
+
+    rect = TILE_RECTS[board_pos[0]][board_pos[1]]
+    pygame.draw.rect(SCREEN, ARROW_BG_COLOR, INNER_RECTS[board_pos[0]][board_pos[1]])
 
     # draw arrow image
     if across:
         img = ARROW_ACROSS_IMG
     else:
         img = ARROW_DOWN_IMG
-    img_pos = img.get_rect(center=(x + SQUARE_SIZE // 2, y + SQUARE_SIZE // 2))
+    img_pos = img.get_rect(center=rect.center)
     SCREEN.blit(img, img_pos)
 
+    return rect
+
 
-def draw_rack(solver: Solver):
-    pygame.draw.rect(SCREEN, RACK_BG_COLOR, RACK_RECT)
+def draw_rack(solver: Solver) -> Rect:
+    SCREEN.blit(render_rack(tuple(solver.rack)), RACK_RECT)
+    return RACK_RECT
 
-    x_offset = (BOARD_SIZE - (len(solver.rack) * (SQUARE_SIZE + RACK_TILES_PADDING) - RACK_TILES_PADDING)) // 2
 
-    for i, tile in enumerate(solver.rack):
-        draw_rack_tile(x_offset + i * (SQUARE_SIZE + RACK_TILES_PADDING), tile)
+@lru_cache(maxsize=16)
+def render_rack(rack: tuple[str, ...]) -> pygame.Surface:
+    # the rack is redrawn whenever the arrow moves but only changes when it is typed into, so whole racks are cached
+    rack_surface = pygame.Surface(RACK_RECT.size).convert()
+    rack_surface.fill(RACK_BG_COLOR)
+
+    tiles_y = RACK_TILES_Y - RACK_RECT.y
+    rack_surface.blits(
+        ((render_rack_tile(tile), (x, tiles_y)) for x, tile in zip(RACK_TILE_XS[len(rack)], rack)), doreturn=False
+    )
 
+    return rack_surface
 
-def draw_rack_tile(x: int, letter: str):
+
+@lru_cache(maxsize=32)
+def render_rack_tile(letter: str) -> pygame.Surface:
+    tile = pygame.Surface((SQUARE_SIZE, SQUARE_SIZE), pygame.SRCALPHA).convert_alpha()
     pygame.draw.rect(
-        SCREEN,
+        tile,
         EXISTING_TILE_PALETTE["tile"],
-        Rect(x, RACK_TILES_Y, SQUARE_SIZE, SQUARE_SIZE),
+        Rect(0, 0, SQUARE_SIZE, SQUARE_SIZE),
         border_radius=TILE_ROUNDED_RADIUS,
     )
 
     # draw letter
-    text = TILE_FONT.render(letter, True, EXISTING_TILE_PALETTE["font"])
-    text_pos = text.get_rect(center=(x + SQUARE_SIZE // 2, RACK_TILES_Y + SQUARE_SIZE // 2))
-    SCREEN.blit(text, text_pos)
+    text = render_text(TILE_FONT, letter, EXISTING_TILE_PALETTE["font"])
+    text_pos = text.get_rect(center=(SQUARE_SIZE // 2, SQUARE_SIZE // 2))
+    tile.blit(text, text_pos)
 
     # not a blank tile
     if letter != " ":
         # draw score
-        text = SCORE_FONT.render(str(rules.TILE_VALUE[letter]), True, EXISTING_TILE_PALETTE["font"])
-        text_pos = text.get_rect(
-            bottomright=(
-                x + SQUARE_SIZE - SCORE_PADDING[0],
-                RACK_TILES_Y + SQUARE_SIZE - SCORE_PADDING[0],
-            )
-        )
-        SCREEN.blit(text, text_pos)
+        text = render_text(SCORE_FONT, str(rules.TILE_VALUE[letter]), EXISTING_TILE_PALETTE["font"])
+        text_pos = text.get_rect(bottomright=(SQUARE_SIZE - SCORE_PADDING[0], SQUARE_SIZE - SCORE_PADDING[0]))
+        tile.blit(text, text_pos)
+
+    return tile
+
+
+def draw_toolbar(solver: Solver) -> Rect:
+    SCREEN.blit(render_toolbar(solver.legal_check), TOOLBAR_RECT)
+    return TOOLBAR_RECT
+
+
+@lru_cache(maxsize=2)
+def render_toolbar(legal_check: bool) -> pygame.Surface:
+    # only the legal check icon ever changes, so there are just two versions of the toolbar
+    toolbar = pygame.Surface(TOOLBAR_RECT.size).convert()
+    toolbar.fill(TOOLBAR_BG_COLOR)
+
+    # all icons are blitted at once, each centred in its button
+    icons = [
+        (UNDO_IMG, UNDO_RECT),
+        (REDO_IMG, REDO_RECT),
+        (CLEAR_EDITS_IMG, CLEAR_EDITS_RECT),
+        (CLEAR_ALL_IMG, CLEAR_ALL_RECT),
+        (LEGAL_CHECK_ON_IMG if legal_check else LEGAL_CHECK_OFF_IMG, LEGAL_CHECK_RECT),
+        (CALC_MOVE_IMG, CALC_MOVE_RECT),
+    ]
+    toolbar.blits(
+        (
+            (img, (rect.x - TOOLBAR_RECT.x + TOOLBAR_ICON_PADDING, rect.y - TOOLBAR_RECT.y + TOOLBAR_ICON_PADDING))
+            for img, rect in icons
+        ),
+        doreturn=False,
+    )
 
+    return toolbar
 
-def draw_toolbar(solver: Solver):
-    pygame.draw.rect(SCREEN, TOOLBAR_BG_COLOR, TOOLBAR_RECT)
 
-    # undo button
-    img_pos = Rect(
-        UNDO_RECT.x + TOOLBAR_ICON_PADDING,
-        UNDO_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(UNDO_IMG, img_pos)
-
-    # redo button
-    img_pos = Rect(
-        REDO_RECT.x + TOOLBAR_ICON_PADDING,
-        REDO_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(REDO_IMG, img_pos)
-
-    # clear edits button
-    img_pos = Rect(
-        CLEAR_EDITS_RECT.x + TOOLBAR_ICON_PADDING,
-        CLEAR_EDITS_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(CLEAR_EDITS_IMG, img_pos)
-
-    # clear all button
-    img_pos = Rect(
-        CLEAR_ALL_RECT.x + TOOLBAR_ICON_PADDING,
-        CLEAR_ALL_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(CLEAR_ALL_IMG, img_pos)
-
-    # legal check button
-    img_pos = Rect(
-        LEGAL_CHECK_RECT.x + TOOLBAR_ICON_PADDING,
-        LEGAL_CHECK_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(LEGAL_CHECK_ON_IMG if solver.legal_check else LEGAL_CHECK_OFF_IMG, img_pos)
-
-    # calc move button
-    img_pos = Rect(
-        CALC_MOVE_RECT.x + TOOLBAR_ICON_PADDING,
-        CALC_MOVE_RECT.y + TOOLBAR_ICON_PADDING,
-        TOOLBAR_ICON_SIZE,
-        TOOLBAR_ICON_SIZE,
-    )
-    SCREEN.blit(CALC_MOVE_IMG, img_pos)
+def draw_status_bar(solver: Solver) -> Rect:
+    SCREEN.blit(render_status_bar(solver.status_text), STATUS_BAR_RECT)
+    return STATUS_BAR_RECT
 
 
-def draw_status_bar(solver: Solver):
-    pygame.draw.rect(SCREEN, STATUS_BAR_BG_COLOR, STATUS_BAR_RECT)
+@lru_cache(maxsize=8)
+def render_status_bar(text: str) -> pygame.Surface:
+    # the status bar is redrawn on every undo and redo, usually with unchanged text, so the last few are kept rendered
+    status_bar = pygame.Surface(STATUS_BAR_RECT.size).convert()
+    status_bar.fill(STATUS_BAR_BG_COLOR)
 
-    status_text = STATUS_BAR_FONT.render(solver.status_text, True, STATUS_BAR_FONT_COLOR)
-    text_pos = status_text.get_rect(
-        topleft=(
-            STATUS_BAR_RECT.x + STATUS_BAR_TEXT_PADDING_X,
-            STATUS_BAR_RECT.y + STATUS_BAR_TEXT_PADDING_Y,
-        )
-    )
-    SCREEN.blit(status_text, text_pos)
+    status_text = STATUS_BAR_FONT.render(text, True, STATUS_BAR_FONT_COLOR)
+    text_pos = status_text.get_rect(topleft=(STATUS_BAR_TEXT_PADDING_X, STATUS_BAR_TEXT_PADDING_Y))
+    status_bar.blit(status_text, text_pos)
+
+    return status_bar
+
+
+@lru_cache(maxsize=256)
+def render_text(font: pygame.font.Font, text: str, color: str) -> pygame.Surface:
+    # tile letters and scores only come in a few dozen font/color combinations, so rasterize each one once
+    return font.render(text, True, color)
+
+
+def square_rect(board_pos: Position) -> Rect:
+    if PositionUtils.out_of_bounds(board_pos):
+        return Rect(0, 0, 0, 0)
+    return TILE_RECTS[board_pos[0]][board_pos[1]]
 
 
 def pos_to_coords(pos: Position) -> Position: